@@ -6,9 +6,9 @@ callables.
 Copyright (C) 2025-2026 Neo Zetterberg
 """
 
-from typing import Any
+from typing import Dict, Any
 from ._internal import (
-    GlobalEnvironment, inspect, print_total_log, print_overview_log
+    GlobalEnvironment, inspect, sample, print_total_log, print_overview_log
 )
 import sys
 
@@ -27,23 +27,28 @@ import sys
 
 class Module:
     __name__, __file__, __spec__ = __name__, __file__, __spec__
+    _MEMBERS: Dict[str, Any] # Filled in below, once `Module` exists.
     def __getattribute__(self, name: str) -> Any:
-        match name:
-            case "GlobalEnvironment":
-                return GlobalEnvironment()
-            case "Module":
-                return Module
-            case "This":
-                return self
-            case "inspect":
-                return inspect
-            case "print_total_log":
-                return print_total_log
-            case "print_overview_log":
-                return print_overview_log
-            case "reset":
-                return GlobalEnvironment.reset
+        # The global environment is replaced by `reset`, so it is the only member 
+        # fetched at access time. Everything else is a plain dict lookup.
+        if name == "GlobalEnvironment":
+            return GlobalEnvironment()
+        if name == "This":
+            return self
+        try:
+            return Module._MEMBERS[name]
+        except KeyError:
+            return object.__getattribute__(self, name)
     def __setattr__(self, name: str, value: Any) -> None:
         raise PermissionError("You are not allowed to change any attribute of this package.")
 
+Module._MEMBERS = {
+    "Module": Module,
+    "inspect": inspect,
+    "sample": sample,
+    "print_total_log": print_total_log,
+    "print_overview_log": print_overview_log,
+    "reset": GlobalEnvironment.reset,
+}
+
 sys.modules[__name__] = Module()
\ No newline at end of file
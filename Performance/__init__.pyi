@@ -1,6 +1,6 @@
 from typing import Type, Callable
 from ._internal import (
-    Environment, inspect, print_total_log, print_overview_log
+    Environment, inspect, sample, print_total_log, print_overview_log
 )
 
 class Module:
@@ -9,6 +9,7 @@ class Module:
     This: Module
 
     inspect: Callable
+    sample: Callable
     print_total_log: Callable
     print_overview_log: Callable
 
@@ -20,6 +21,7 @@ __all__ = (
     "Module",
     "This",
     "inspect",
+    "sample",
     "print_total_log",
     "print_overview_log"
 )
\ No newline at end of file
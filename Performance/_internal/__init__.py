@@ -2,7 +2,8 @@ from typing import TYPE_CHECKING
 from .core import (
     Environment, 
     GlobalEnvironment,
-    inspect
+    inspect,
+    sample
 )
 from .utils import (
     print_total_log,
@@ -13,6 +14,7 @@ if TYPE_CHECKING:
         "Environment",
         "GlobalEnvironment",
         "inspect",
+        "sample",
         "print_total_log",
         "print_overview_log"
     )
\ No newline at end of file
@@ -1,7 +1,12 @@
 from typing import (
-    Set, List, Dict, ParamSpec, TypeVar, Type, Generic, Callable, Union, Optional, Any
+    List, Dict, Tuple, Deque, NamedTuple, ParamSpec, TypeVar, Type, Generic, Callable, Union, Optional, Any
 )
-import inspect as _inspect
+from collections import deque
+from dataclasses import dataclass
+from operator import attrgetter
+import heapq
+import bisect
+from types import FunctionType, MethodType
 import threading
 import time
 import sys
@@ -9,61 +14,112 @@ import sys
 P = ParamSpec("P")
 T = TypeVar("T")
 
+# On CPython the GIL makes copying the history and reading the stats tuple atomic, so 
+# readers can skip the method lock. Other runtimes, and free-threaded CPython builds 
+# running without the GIL, keep the lock. Recording always takes it, since advancing 
+# the stats is a read-modify-write.
+_CPYTHON = sys.implementation.name == "cpython" and getattr(sys, "_is_gil_enabled", lambda: True)()
+
+# Timestamps are kept as integer nanoseconds and only turned into float seconds 
+# when read, which spares the hot path a float allocation per timestamp.
+_perf_ns = time.perf_counter_ns
+_NS = 1e-9
+
+# What a Method stores per call: (start_ns, end_ns, result, exception). Wrapped into a 
+# Resolve only when read, so recording a call allocates no Resolve object.
+_Record = Tuple[int, int, Any, Optional[Exception]]
+_by_start = attrgetter("start_ns")
+
+# Code flags from `inspect`, copied so the module isn't needed just for these.
+_CO_VARARGS = 0x04
+_CO_VARKEYWORDS = 0x08
+
+# Running (calls, total_ns, min_ns, max_ns) kept per method, so aggregates never rescan history.
+_EMPTY_STATS = (0, 0, float("inf"), float("-inf"))
+
+def _advance(stats: Tuple[int, int, int, int], duration: int) -> Tuple[int, int, int, int]:
+    calls, total, minimum, maximum = stats
+    return (
+        calls + 1, 
+        total + duration, 
+        duration if duration < minimum else minimum, 
+        duration if duration > maximum else maximum
+    )
+
 class Environment:
-    _Environment__start: float
-    _Environment__methods: Set["Method"]
+    _Environment__start: int
+    _Environment__methods: List["Method"]
     _Environment__lock: threading.RLock
     __slots__ = ("_Environment__start", "_Environment__methods", "_Environment__lock")
 
     def __init__(self) -> None:
-        object.__setattr__(self, "_Environment__start", time.perf_counter())
-        object.__setattr__(self, "_Environment__methods", set())
+        object.__setattr__(self, "_Environment__start", _perf_ns())
+        object.__setattr__(self, "_Environment__methods", [])
         object.__setattr__(self, "_Environment__lock", threading.RLock())
 
     @property
     def start(self) -> float:
+        return self._Environment__start * _NS
+    
+    @property
+    def start_ns(self) -> int:
         return self._Environment__start
     
+    def _stats(self) -> List[Tuple[int, int, int, int]]:
+        """Snapshot the cached stats of every method that has been called at least once."""
+        with self._Environment__lock:
+            methods = tuple(self._Environment__methods)
+        stats = [method._Method__stats for method in methods]
+        return [s for s in stats if s[0]]
+    
     @property
     def total_calls(self) -> int:
-        with self._Environment__lock:
-            return sum(method.total_calls for method in self._Environment__methods)
+        return sum(s[0] for s in self._stats())
     
     @property
     def total_duration(self) -> float:
-        with self._Environment__lock:
-            with self._Environment__lock:
-                vals = [m.min_duration for m in self._Environment__methods if m.min_duration is not None]
-            return sum(vals) if vals else 0.0
+        return sum(s[1] for s in self._stats()) * _NS
         
     @property
     def min_duration(self) -> float:
-        with self._Environment__lock:
-            with self._Environment__lock:
-                vals = [m.min_duration for m in self._Environment__methods if m.min_duration is not None]
-            return min(vals) if vals else 0.0
+        stats = self._stats()
+        return min(s[2] for s in stats) * _NS if stats else 0.0
     
     @property
     def max_duration(self) -> float:
-        with self._Environment__lock:
-            with self._Environment__lock:
-                vals = [m.min_duration for m in self._Environment__methods if m.min_duration is not None]
-            return min(vals) if vals else 0.0
+        stats = self._stats()
+        return max(s[3] for s in stats) * _NS if stats else 0.0
     
     @property
     def avg_duration(self) -> float:
-        with self._Environment__lock:
-            with self._Environment__lock:
-                vals = [m.min_duration for m in self._Environment__methods if m.min_duration is not None]
-            return sum(vals) / len(vals) if vals else 0.0
+        stats = self._stats()
+        calls = sum(s[0] for s in stats)
+        return sum(s[1] for s in stats) * _NS / calls if calls else 0.0
     
     @property
     def history(self) -> List["Resolve"]:
+        """
+        The recorded calls of every method in start order. A method keeps only its latest 
+        `history_size` calls, so once one has dropped calls, the timeline starts at the 
+        oldest call it still holds; earlier calls of other methods are left out as well.
+        """
         with self._Environment__lock:
-            resolves = []
-            for method in self._Environment__methods:
-                resolves.extend(method.history)
-            return sorted(resolves, key=lambda m: m.start)
+            methods = tuple(self._Environment__methods)
+        # Each history is already close to start order (only nested or concurrent calls 
+        # land out of order), so sorting it is near-linear. A k-way merge of the sorted 
+        # runs then avoids re-sorting everything together.
+        runs = []
+        cutoff = None
+        for method in methods:
+            run = sorted(method.history, key=_by_start)
+            if run and len(run) == method._Method__history.maxlen and method._Method__stats[0] > len(run):
+                first = run[0].start_ns
+                if cutoff is None or first > cutoff:
+                    cutoff = first
+            runs.append(run)
+        if cutoff is not None:
+            runs = [run[bisect.bisect_left(run, cutoff, key=_by_start):] for run in runs]
+        return list(heapq.merge(*runs, key=_by_start))
 
     @property
     def methods(self) -> List["Method"]:
@@ -72,11 +128,14 @@ class Environment:
     
     def add(self, method: "Method") -> None:
         with self._Environment__lock:
-            self._Environment__methods.add(method)
+            self._Environment__methods.append(method)
     
     def remove(self, method: "Method") -> None:
         with self._Environment__lock:
-            self._Environment__methods.remove(method)
+            try:
+                self._Environment__methods.remove(method)
+            except ValueError:
+                raise KeyError(method) from None # as when the methods were kept in a set
     
     def clear(self) -> None:
         with self._Environment__lock:
@@ -87,51 +146,50 @@ class Environment:
 
 _GLOBAL_ENVIRONMENT = Environment()
 
-class Resolve:
-    _Resolve__method: "Method"
-    _Resolve__start: float
-    _Resolve__end: float
-    _Resolve__result: Any
-    _Resolve__exception: Optional[Exception]
-    __slots__ = ("_Resolve__method", "_Resolve__start", "_Resolve__end", "_Resolve__result", "_Resolve__exception")
-
-    def __init__(self, method: "Method", start: float, end: float, result: Any, exception: Optional[Exception] = None) -> None:
-        object.__setattr__(self, "_Resolve__method", method)
-        object.__setattr__(self, "_Resolve__start", start)
-        object.__setattr__(self, "_Resolve__end", end)
-        object.__setattr__(self, "_Resolve__result", result)
-        object.__setattr__(self, "_Resolve__exception", exception)
-    
-    @property
-    def method(self) -> "Method":
-        return self._Resolve__method
+class Resolve(NamedTuple):
+    """
+    Immutable record of a single call. A named tuple, so construction fills every 
+    field at once in C and mutation is refused natively.
+
+    `start_ns` and `end_ns` are `time.perf_counter_ns` readings.
+    """
+    method: "Method"
+    start_ns: int
+    end_ns: int
+    result: Any
+    exception: Optional[Exception] = None
     
     @property
     def start(self) -> float:
-        return self._Resolve__start
+        return self.start_ns * _NS
     
     @property
     def end(self) -> float:
-        return self._Resolve__end
+        return self.end_ns * _NS
 
     @property
     def duration(self) -> float:
-        return self._Resolve__end - self._Resolve__start
+        return (self.end_ns - self.start_ns) * _NS
     
     @property
-    def result(self) -> Any:
-        return self._Resolve__result
-    
-    @property
-    def exception(self) -> Optional[Exception]:
-        return self._Resolve__exception
-    
-    def __setattr__(self, name: str, value: Any) -> None:
-        raise AttributeError("Resolve objects are immutable")
+    def duration_ns(self) -> int:
+        return self.end_ns - self.start_ns
     
     def __repr__(self) -> str:
         return f"<Resolve func={self.method.name!r} duration={self.duration:.6f}s exception={bool(self.exception)}>"
 
+@dataclass(frozen=True)
+class Snapshot:
+    """Consistent, point-in-time view of a Method's statistics (seconds)."""
+    name: Optional[str]
+    created_at: float
+    total_duration: float
+    total_calls: int
+    min_duration: float
+    max_duration: float
+    avg_duration: float
+    calls_per_second: float
+
 class Method(Generic[P, T], Callable):
     """
     Wraps a callable and records timings / exceptions.
@@ -140,31 +198,46 @@ class Method(Generic[P, T], Callable):
     - Thread-safe.
     - Preserves tracebacks on exceptions.
     - Supports async callables (returns a coroutine you can `await`).
+    - Keeps only the latest `history_size` calls in `history`; totals still count every call.
     """
 
+    history_size: int = 10_000
+
     _Method__method: Callable[P, T]
-    _Method__created_at: float
-    _Method__last_resolve: Optional[Resolve]
-    _Method__history: List[Resolve]
+    _Method__created_at: int
+    _Method__last_resolve: Optional[_Record]
+    _Method__history: Deque[_Record]
     _Method__lock: threading.Lock
-    _Method__total_duration: float
-    _Method__total_calls: int
-    _Method__default_args: List[Any]
+    _Method__stats: Tuple[int, int, int, int] # (calls, total, min, max) in ns, swapped as one object
+    _Method__default_args: Tuple[Any, ...]
     _Method__default_kwargs: Dict[str, Any]
-    __slots__ = ("_Method__method", "_Method__created_at", "_Method__last_resolve", "_Method__history", "_Method__lock", "_Method__total_duration", "_Method__total_calls", "_Method__default_args", "_Method__default_kwargs")
+    _Method__owner_prefix: Optional[Tuple[Any, ...]] # None until the owner is resolved
+    _Method__history_cache: Tuple[Any, Tuple[Resolve, ...]] # (stats it was built at, snapshot)
+    __slots__ = ("_Method__method", "_Method__created_at", "_Method__last_resolve", "_Method__history", "_Method__lock", "_Method__stats", "_Method__default_args", "_Method__default_kwargs", "_Method__owner_prefix", "_Method__history_cache")
+
+    def __new__(cls, method: Callable[P, T], *args: Any, **kwargs: Any) -> "Method[P, T]":
+        # Callables without parameters get a `__call__` that packs no arguments at all.
+        if cls is Method and not args and not kwargs and _takes_no_arguments(method):
+            cls = _NoArgMethod
+        return super().__new__(cls)
 
     def __init__(self, method: Callable[P, T], *args: Any, **kwargs: Any) -> None:
         if not callable(method):
             raise TypeError("Function requires a callable")
         self._Method__method = method
-        self._Method__created_at = time.perf_counter()
+        self._Method__created_at = _perf_ns()
         self._Method__last_resolve = None
-        self._Method__history = []
+        self._Method__history = deque(maxlen=self.history_size)
         self._Method__lock = threading.Lock()
-        self._Method__total_calls = 0
-        self._Method__total_duration = 0.0
-        self._Method__default_args = list(args)
-        self._Method__default_kwargs = dict(kwargs)
+        self._Method__stats = _EMPTY_STATS
+        self._Method__history_cache = (None, ())
+        self._Method__default_args = args
+        self._Method__default_kwargs = kwargs
+        # A module-level function never has an owner; anything else is resolved on first use.
+        if isinstance(method, FunctionType) and "." not in method.__qualname__:
+            self._Method__owner_prefix = ()
+        else:
+            self._Method__owner_prefix = None
         _GLOBAL_ENVIRONMENT.add(self)
     
     @property
@@ -177,25 +250,45 @@ class Method(Generic[P, T], Callable):
     
     @property
     def owner(self) -> Optional[Type]:
+        prefix = self._Method__owner_prefix
+        if prefix is None:
+            prefix = self.__resolve_owner()
+        return prefix[0] if prefix else None
+    
+    def __resolve_owner(self) -> Tuple[Any, ...]:
+        """
+        Find the owner once and cache it as the argument prefix used by every call. 
+        This is deferred to first use, since a function decorated inside a class body 
+        is wrapped before its class exists in the module.
+        """
+        owner = self.__find_owner()
+        prefix = (owner,) if owner is not None else ()
+        self._Method__owner_prefix = prefix
+        return prefix
+    
+    def __find_owner(self) -> Optional[Type]:
         obj = self._Method__method
 
         # Case 1: bound method
-        if _inspect.ismethod(obj):
+        if isinstance(obj, MethodType):
             return obj.__self__.__class__
         
         # Case 2: callable class instance
-        if hasattr(obj, "__call__") and not _inspect.isfunction(obj):
+        if hasattr(obj, "__call__") and not isinstance(obj, FunctionType):
             typ = obj.__class__
             # don't treat function objects as callable instances
             if typ is not type(lambda: None):
                 return typ
         
         # Case 3: function defined inside a class (unbound method)
-        if _inspect.isfunction(obj):
+        if isinstance(obj, FunctionType):
             qual = obj.__qualname__
             if "." in qual:
                 cls_name = qual.split(".")[0]
-                module = _inspect.getmodule(obj)
+                module = sys.modules.get(obj.__module__)
+                if module is None:
+                    import inspect as _inspect # rare: only when the module isn't registered
+                    module = _inspect.getmodule(obj)
                 if hasattr(module, cls_name):
                     cls = getattr(module, cls_name)
                     if isinstance(cls, type):
@@ -205,97 +298,198 @@ class Method(Generic[P, T], Callable):
     
     @property
     def created_at(self) -> float:
-        return self._Method__created_at
+        return self._Method__created_at * _NS
     
     @property
     def resolve(self) -> Optional[Resolve]:
-        return self._Method__last_resolve
+        record = self._Method__last_resolve
+        return Resolve(self, *record) if record is not None else None
     
     @property
-    def history(self) -> List[Resolve]:
-        with self._Method__lock:
-            return list(self._Method__history)
+    def history(self) -> Tuple[Resolve, ...]:
+        """
+        Immutable snapshot of the recorded calls. It is rebuilt only after new calls 
+        were recorded; the stats tuple, replaced on every record, acts as generation.
+        """
+        generation, snapshot = self._Method__history_cache
+        stats = self._Method__stats
+        if generation is stats:
+            return snapshot
+        if _CPYTHON:
+            records = list(self._Method__history)
+        else:
+            with self._Method__lock:
+                records = list(self._Method__history)
+        snapshot = tuple([Resolve(self, *record) for record in records])
+        self._Method__history_cache = (stats, snapshot)
+        return snapshot
     
     @property
     def avg_duration(self) -> float:
-        with self._Method__lock:
-            if self._Method__total_calls == 0:
-                return 0.0
-            return self._Method__total_duration / self._Method__total_calls
+        calls, total, _, _ = self._Method__stats
+        if calls == 0:
+            return 0.0
+        return total * _NS / calls
 
     @property
     def min_duration(self) -> float:
-        with self._Method__lock:
-            if not self._Method__history:
-                return 0.0
-            return min(r.duration for r in self._Method__history)
+        calls, _, minimum, _ = self._Method__stats
+        return minimum * _NS if calls else 0.0
 
     @property
     def max_duration(self) -> float:
-        with self._Method__lock:
-            if not self._Method__history:
-                return 0.0
-            return max(r.duration for r in self._Method__history)
+        calls, _, _, maximum = self._Method__stats
+        return maximum * _NS if calls else 0.0
 
     @property
     def calls_per_second(self) -> float:
-        elapsed = time.perf_counter() - self._Method__created_at
+        elapsed = _perf_ns() - self._Method__created_at
+        calls = self._Method__stats[0]
         if elapsed <= 0:
-            return float("inf") if self._Method__total_calls > 0 else 0.0
-        with self._Method__lock:
-            return self._Method__total_calls / elapsed
+            return float("inf") if calls > 0 else 0.0
+        return calls / (elapsed * _NS)
     
     @property
     def total_duration(self) -> float:
-        with self._Method__lock:
-            return self._Method__total_duration
+        return self._Method__stats[1] * _NS
     
     @property
     def total_calls(self) -> int:
-        with self._Method__lock:
-            return self._Method__total_calls
+        return self._Method__stats[0]
+    
+    def snapshot(self) -> Snapshot:
+        """
+        Read every statistic from a single stats read, instead of one read (and 
+        possibly one lock) per property.
+        """
+        if _CPYTHON:
+            stats = self._Method__stats
+        else:
+            with self._Method__lock:
+                stats = self._Method__stats
+        now = _perf_ns()
+        calls, total, minimum, maximum = stats
+        created_at = self._Method__created_at
+        elapsed = now - created_at
+        if elapsed <= 0:
+            cps = float("inf") if calls > 0 else 0.0
+        else:
+            cps = calls / (elapsed * _NS)
+        return Snapshot(
+            name=self.name,
+            created_at=created_at * _NS,
+            total_duration=total * _NS,
+            total_calls=calls,
+            min_duration=minimum * _NS if calls else 0.0,
+            max_duration=maximum * _NS if calls else 0.0,
+            avg_duration=total * _NS / calls if calls else 0.0,
+            calls_per_second=cps
+        )
     
     def reset(self) -> None:
         with self._Method__lock:
             self._Method__last_resolve = None
-            self._Method__total_duration = 0.0
-            self._Method__total_calls = 0
             self._Method__history.clear()
-            self._Method__created_at = time.perf_counter()
+            self._Method__stats = _EMPTY_STATS
+            self._Method__created_at = _perf_ns()
     
     def get_method(self) -> Callable[P, T]:
         return self._Method__method
     
-    def _record(self, resolve: Resolve) -> None:
+    def _record(self, start: int, end: int, result: Any, exception: Optional[Exception] = None) -> None:
+        record = (start, end, result, exception)
+        # The stats are swapped last, since they also mark a new history generation.
         with self._Method__lock:
-            self._Method__last_resolve = resolve
-            self._Method__total_duration += resolve.duration
-            self._Method__total_calls += 1
-            self._Method__history.append(resolve)
+            self._Method__history.append(record)
+            self._Method__last_resolve = record
+            self._Method__stats = _advance(self._Method__stats, end - start)
 
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
         if not args and not kwargs:
-            args = list(self._Method__default_args)
-            kwargs = dict(self._Method__default_kwargs)
-        owner = self.owner
-        args = ([owner] if owner is not None else []) + list(args)
-        kwargs = dict(kwargs)
-        start = time.perf_counter()
+            # Both are only ever unpacked, so the stored defaults need no copy.
+            args = self._Method__default_args
+            kwargs = self._Method__default_kwargs
+        prefix = self._Method__owner_prefix
+        if prefix is None:
+            prefix = self.__resolve_owner()
+        start = _perf_ns()
         try:
-            res = self._Method__method(*args, **kwargs)
-            self._Method__method.__class__
+            res = self._Method__method(*prefix, *args, **kwargs)
         except Exception as e:
             res = None
-            end = time.perf_counter()
-            resolve = Resolve(self, start, end, res, sys.exc_info())
-            self._record(resolve)
+            self._record(start, _perf_ns(), res, sys.exc_info())
+            raise
+        end = _perf_ns()
+        # Same as `_record`, inlined to save a Python frame on the common path.
+        record = (start, end, res, None)
+        with self._Method__lock:
+            self._Method__history.append(record)
+            self._Method__last_resolve = record
+            self._Method__stats = _advance(self._Method__stats, end - start)
+        return res
+
+def _takes_no_arguments(method: Callable) -> bool:
+    """Whether `method` is a plain module-level function that accepts no arguments."""
+    if not isinstance(method, FunctionType) or "." in method.__qualname__:
+        return False
+    code = method.__code__
+    return (
+        code.co_argcount == 0 and code.co_kwonlyargcount == 0
+        and not code.co_flags & (_CO_VARARGS | _CO_VARKEYWORDS)
+    )
+
+class _NoArgMethod(Method[P, T]):
+    """
+    `Method` specialized for functions without parameters. Having no owner and no 
+    defaults to merge, the call skips argument packing and unpacking entirely.
+    """
+    __slots__ = ()
+
+    def __call__(self) -> T:
+        start = _perf_ns()
+        try:
+            res = self._Method__method()
+        except Exception:
+            self._record(start, _perf_ns(), None, sys.exc_info())
             raise
-        end = time.perf_counter()
-        resolve = Resolve(self, start, end, res, None)
-        self._record(resolve)
+        end = _perf_ns()
+        record = (start, end, res, None)
+        with self._Method__lock:
+            self._Method__history.append(record)
+            self._Method__last_resolve = record
+            self._Method__stats = _advance(self._Method__stats, end - start)
         return res
 
+class _SampledMethod(Method[P, T]):
+    """
+    `Method` that records only every n-th call; the calls in between go straight 
+    to the callable. The countdown is not locked, so under threads the stride is 
+    approximate.
+    """
+    _SampledMethod__every: int
+    _SampledMethod__skip: int
+    __slots__ = ("_SampledMethod__every", "_SampledMethod__skip")
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T:
+        skip = self._SampledMethod__skip
+        if not skip:
+            self._SampledMethod__skip = self._SampledMethod__every - 1
+            return Method.__call__(self, *args, **kwargs)
+        self._SampledMethod__skip = skip - 1
+        if not args and not kwargs:
+            args = self._Method__default_args
+            kwargs = self._Method__default_kwargs
+        prefix = self._Method__owner_prefix
+        if prefix is None:
+            prefix = self._Method__resolve_owner()
+        return self._Method__method(*prefix, *args, **kwargs)
+
 class GlobalEnvironment:
+    """
+    Callable handle to the global Environment. Calling it returns the current 
+    environment without allocating; `reset` replaces it with a fresh one.
+    """
+    __slots__ = ()
     def reset(self) -> None: # _GLOBAL_ENVIRONMENT is safe, since this isn't provided in the .pyi
         global _GLOBAL_ENVIRONMENT
         del _GLOBAL_ENVIRONMENT
@@ -342,4 +536,24 @@ def inspect(func: Optional[Callable[P, T]] = None, /, *args: Any, **kwargs: Any)
     def decorator(func: Callable[P, T]) -> Method[P, T]:
         return Method(func, *args, **kwargs)
     if func: return decorator(func)
-    return decorator
\ No newline at end of file
+    return decorator
+
+def sample(every: int, func: Optional[Callable[P, T]] = None, /, *args: Any, **kwargs: Any) -> Union[Method[P, T], DecoratorLike]:
+    """
+    Like `inspect`, but only every `every`-th call is timed and recorded. The others 
+    call the function directly, so hot functions can be inspected without paying for 
+    it on every call. The totals and the history then describe the sampled calls only.
+
+    Usage:
+      @sample(1000)
+      def f(...): ...
+    """
+    if every < 1:
+        raise ValueError("every must be at least 1")
+    def decorator(func: Callable[P, T]) -> Method[P, T]:
+        method = _SampledMethod(func, *args, **kwargs)
+        method._SampledMethod__every = every
+        method._SampledMethod__skip = 0
+        return method
+    if func: return decorator(func)
+    return decorator
@@ -1,5 +1,5 @@
 from typing import (
-    List, ParamSpec, TypeVar, Type, Generic, Callable, Union, Optional, Any
+    List, Tuple, NamedTuple, ParamSpec, TypeVar, Type, Generic, Callable, Union, Optional, Any
 )
 
 P = ParamSpec("P")
@@ -9,6 +9,8 @@ class Environment:
     @property
     def start(self) -> float: ...
     @property
+    def start_ns(self) -> int: ...
+    @property
     def total_calls(self) -> int: ...
     @property
     def total_duration(self) -> float: ...
@@ -26,10 +28,12 @@ class Environment:
     def remove(self, method: "Method") -> None: ...
     def clear(self) -> None: ...
 
-class Resolve:
-    def __init__(self, method: "Method", start: float, end: float, result: Any, exception: Optional[Exception] = None) -> None: ...
-    @property
-    def method(self) -> "Method": ...
+class Resolve(NamedTuple):
+    method: "Method"
+    start_ns: int
+    end_ns: int
+    result: Any
+    exception: Optional[Exception] = None
     @property
     def start(self) -> float: ...
     @property
@@ -37,13 +41,21 @@ class Resolve:
     @property
     def duration(self) -> float: ... 
     @property
-    def result(self) -> Any: ...
-    @property
-    def exception(self) -> Optional[Exception]: ...
-    def __setattr__(self, name: str, value: Any) -> None: ...
+    def duration_ns(self) -> int: ...
     def __repr__(self) -> str: ...
 
+class Snapshot:
+    name: Optional[str]
+    created_at: float
+    total_duration: float
+    total_calls: int
+    min_duration: float
+    max_duration: float
+    avg_duration: float
+    calls_per_second: float
+
 class Method(Generic[P, T]):
+    history_size: int
     def __init__(self, method: Callable[P, T], *args: Any, **kwargs: Any) -> None: ...
     @property
     def name(self) -> Optional[str]: ...
@@ -56,7 +68,7 @@ class Method(Generic[P, T]):
     @property
     def resolve(self) -> Optional[Resolve]: ...
     @property
-    def history(self) -> List[Resolve]: ...
+    def history(self) -> Tuple[Resolve, ...]: ...
     @property
     def avg_duration(self) -> float: ...
     @property
@@ -69,9 +81,10 @@ class Method(Generic[P, T]):
     def total_duration(self) -> float: ...
     @property
     def total_calls(self) -> int: ...
+    def snapshot(self) -> Snapshot: ...
     def reset(self) -> None: ...
     def get_method(self) -> Callable[P, T]: ...
-    def _record(self, resolve: Resolve) -> None: ...
+    def _record(self, start: int, end: int, result: Any, exception: Optional[Exception] = None) -> None: ...
     def __call__(self, *args: P.args, **kwargs: P.kwargs) -> T: ...
 
 class GlobalEnvironment:
@@ -79,4 +92,5 @@ class GlobalEnvironment:
 
 DecoratorLike = Callable[[Callable[P, T]], Method[P, T]]
 
-def inspect(func: Optional[Callable[P, T]] = None, /, *args: Any, **kwargs: Any) -> Union[Method[P, T], DecoratorLike]: ...
\ No newline at end of file
+def inspect(func: Optional[Callable[P, T]] = None, /, *args: Any, **kwargs: Any) -> Union[Method[P, T], DecoratorLike]: ...
+def sample(every: int, func: Optional[Callable[P, T]] = None, /, *args: Any, **kwargs: Any) -> Union[Method[P, T], DecoratorLike]: ...
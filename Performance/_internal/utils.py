@@ -1,4 +1,4 @@
-from typing import List, Sequence, Tuple, Optional
+from typing import Dict, List, Sequence, Tuple, Optional
 from .core import GlobalEnvironment, Environment
 
 
@@ -7,10 +7,23 @@ from .core import GlobalEnvironment, Environment
 def _fmt(x: Optional[float]) -> str:
     return f"{x:.6f}" if x is not None else "N/A"
 
+# Characters a float literal can start with, "inf"/"nan" included. Anything else 
+# (like the function names of the `Name` column) is rejected without parsing.
+_NUMBER_START = frozenset("+-.0123456789iInN")
+
 def _is_number_string(s: str) -> bool:
     """Return True if s represents an int/float (simple heuristic)."""
     if not s:
         return False
+    first = s[0]
+    # float() also takes leading whitespace and non-ASCII digits, so those fall through to it.
+    if first not in _NUMBER_START and first.isascii() and not first.isspace():
+        return False
+    # Plain decimals (everything `_fmt` produces) are settled by C-level string 
+    # checks; only exotic forms like "1e-05" or "inf" go through float().
+    digits = (s[1:] if s[0] in "+-" else s).replace(".", "", 1)
+    if digits.isascii() and digits.isdigit():
+        return True
     try:
         float(s)
         return True
@@ -18,11 +31,16 @@ def _is_number_string(s: str) -> bool:
         return False
 
 
+# Layouts remembered per set of titles for `keep_layout`: (widths, numeric columns).
+_LAYOUTS: Dict[Tuple[str, ...], Tuple[List[int], List[bool]]] = {}
+_LAYOUTS_MAX = 64
+
 def get_table_string(
     titles: Sequence[str],
     rows: Sequence[Sequence[str]],
     sep: str = " | ",
     color_header: bool = False,
+    keep_layout: bool = False,
 ) -> str:
     """
     Build and return a left/right-aligned table as a single string.
@@ -31,40 +49,51 @@ def get_table_string(
     - rows: sequence of rows (each row is a sequence of strings)
     - sep: column separator string (default " | ")
     - color_header: if True, colorize header using ANSI escapes (if your terminal supports it)
+    - keep_layout: if True, reuse the layout of the previous table with the same titles; 
+      columns only grow and numeric detection is skipped (useful for live refreshing)
 
     The function auto-detects numeric columns and right-aligns them; other columns are left-aligned.
     """
     ncols = len(titles)
-    # normalize rows (ensure each row has exactly ncols columns)
-    norm_rows: List[Tuple[str, ...]] = []
+    header_titles = [str(t) for t in titles]
+    key = tuple(header_titles)
+    layout = _LAYOUTS.get(key) if keep_layout else None
+    widths = [len(t) for t in header_titles]
+    if layout is not None:
+        widths = [max(w, hint) for w, hint in zip(widths, layout[0])]
+    # A column is numeric if it has at least one non-empty value and every one parses as a number
+    detect = layout is None
+    numeric_cols = [True] * ncols if detect else list(layout[1])
+    has_values = [False] * ncols if detect else [True] * ncols
+
+    # Single pass: normalize rows (exactly ncols columns) while tracking widths and numeric columns
+    norm_rows: List[List[str]] = []
     for r in rows:
-        rlist = list(r)
-        if len(rlist) < ncols:
-            rlist.extend("" for _ in range(ncols - len(rlist)))
-        elif len(rlist) > ncols:
-            rlist = rlist[:ncols]
-        norm_rows.append(tuple(str(v) for v in rlist))
-
-    # Determine column widths (consider header and all rows)
-    widths = [
-        max(len(str(titles[c])), *(len(row[c]) for row in norm_rows)) if norm_rows else len(str(titles[c]))
-        for c in range(ncols)
+        cells = [str(v) for v in list(r)[:ncols]]
+        if len(cells) < ncols:
+            cells.extend("" for _ in range(ncols - len(cells)))
+        for c, cell in enumerate(cells):
+            if len(cell) > widths[c]:
+                widths[c] = len(cell)
+            if detect and cell and numeric_cols[c]:
+                has_values[c] = True
+                numeric_cols[c] = _is_number_string(cell)
+        norm_rows.append(cells)
+
+    numeric_cols = [numeric and seen for numeric, seen in zip(numeric_cols, has_values)]
+    if keep_layout and norm_rows:
+        if len(_LAYOUTS) >= _LAYOUTS_MAX and key not in _LAYOUTS:
+            _LAYOUTS.clear()
+        _LAYOUTS[key] = (widths, numeric_cols)
+
+    # Pick the alignment once per column
+    aligns = [
+        (str.rjust if numeric else str.ljust, width)
+        for numeric, width in zip(numeric_cols, widths)
     ]
 
-    # Determine numeric columns: True if every non-empty row value in that column parses as a number
-    numeric_cols = []
-    for c in range(ncols):
-        col_vals = [row[c] for row in norm_rows if row[c] != ""]
-        numeric_cols.append(bool(col_vals) and all(_is_number_string(v) for v in col_vals))
-
     # Format header
-    header_cells = []
-    for c in range(ncols):
-        if numeric_cols[c]:
-            header_cells.append(f"{titles[c]:>{widths[c]}}")
-        else:
-            header_cells.append(f"{titles[c]:<{widths[c]}}")
-    header = sep.join(header_cells)
+    header = sep.join([just(t, w) for t, (just, w) in zip(header_titles, aligns)])
 
     # Optionally colorize header (ANSI)
     if color_header:
@@ -76,15 +105,10 @@ def get_table_string(
     divider = "=" * total_width
 
     # Format rows
-    row_lines = []
-    for row in norm_rows:
-        cells = []
-        for c in range(ncols):
-            if numeric_cols[c]:
-                cells.append(f"{row[c]:>{widths[c]}}")
-            else:
-                cells.append(f"{row[c]:<{widths[c]}}")
-        row_lines.append(sep.join(cells))
+    row_lines = [
+        sep.join([just(cell, w) for cell, (just, w) in zip(row, aligns)])
+        for row in norm_rows
+    ]
 
     # Assemble
     parts = [header, divider]
@@ -101,41 +125,48 @@ def print_table(
     rows: Sequence[Sequence[str]],
     sep: str = " | ",
     color_header: bool = False,
+    keep_layout: bool = False,
 ) -> None:
     """Build table with get_table_string and print it."""
-    print(get_table_string(titles, rows, sep=sep, color_header=color_header))
+    print(get_table_string(titles, rows, sep=sep, color_header=color_header, keep_layout=keep_layout))
 
 
 # ---------- specialized printers for your environment ----------
 
-def print_total_log(count: int = 10, color_header: bool = False) -> None:
+def print_total_log(count: int = 10, color_header: bool = False, keep_layout: bool = False) -> None:
     """
     Print the history of individual calls relative to environment start time.
 
     Columns: Name (left), Start (right), Duration (right), End (right)
     Numeric values formatted to 6 decimal places.
+    Pass keep_layout=True when printing repeatedly to reuse the column layout.
+    Once a method has dropped its oldest calls (see `Method.history_size`), the log 
+    starts at the oldest call still held, and says so.
     """
     env: Environment = GlobalEnvironment()
-    start = env.start
+    start = env.start_ns
 
+    # Timestamps are integer nanoseconds; convert to seconds only when formatting.
     rows: List[List[str]] = [
         [
             res.method.name,
-            _fmt(res.start - start),
-            _fmt(res.duration),
-            _fmt(res.end - start),
+            _fmt((res.start_ns - start) * 1e-9),
+            _fmt(res.duration_ns * 1e-9),
+            _fmt((res.end_ns - start) * 1e-9),
         ]
         for res in env.history
     ]
 
     titles = ["Name", "Start", "Duration", "End"]
-    print_table(titles, rows[:count], sep=" | ", color_header=color_header)
+    if len(rows) < env.total_calls:
+        print("(earlier calls were dropped from the history)")
+    print_table(titles, rows[:count], sep=" | ", color_header=color_header, keep_layout=keep_layout)
     row_count = len(rows)
     if row_count > count:
         print(f"+{row_count - count} others...")
 
 
-def print_overview_log(color_header: bool = False) -> None:
+def print_overview_log(color_header: bool = False, keep_layout: bool = False) -> None:
     """
     Print a summary/overview of tracked methods.
 
@@ -149,25 +180,27 @@ def print_overview_log(color_header: bool = False) -> None:
       Calls per second (right),
       Total calls (right)
     Numeric values formatted to 6 decimals (except Total calls).
+    Pass keep_layout=True when printing repeatedly to reuse the column layout.
     """
     env: Environment = GlobalEnvironment()
     start = env.start
 
     rows: List[List[str]] = []
     for mthd in env.methods:
+        snap = mthd.snapshot()
         rows.append([
-            mthd.name,
-            _fmt(mthd.created_at - start),
-            _fmt(mthd.total_duration),
-            _fmt(mthd.avg_duration),
-            _fmt(mthd.min_duration),
-            _fmt(mthd.max_duration),
-            _fmt(mthd.calls_per_second),
-            str(mthd.total_calls),
+            snap.name,
+            _fmt(snap.created_at - start),
+            _fmt(snap.total_duration),
+            _fmt(snap.avg_duration),
+            _fmt(snap.min_duration),
+            _fmt(snap.max_duration),
+            _fmt(snap.calls_per_second),
+            str(snap.total_calls),
         ])
 
     titles = [
         "Name", "Creation", "Total", "Avg.", "Min.", "Max. duration",
         "Calls per second", "Total calls"
     ]
-    print_table(titles, rows, sep=" | ", color_header=color_header)
+    print_table(titles, rows, sep=" | ", color_header=color_header, keep_layout=keep_layout)
@@ -1,2 +1,2 @@
-def print_total_log(count: int = 10, color_header: bool = False) -> None: ...
-def print_overview_log(color_header: bool = False) -> None: ...
\ No newline at end of file
+def print_total_log(count: int = 10, color_header: bool = False, keep_layout: bool = False) -> None: ...
+def print_overview_log(color_header: bool = False, keep_layout: bool = False) -> None: ...
\ No newline at end of file
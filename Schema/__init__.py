@@ -25,7 +25,7 @@ Scanning can be imported as:
 Copyright (C) 2025-2026 Neo Zetterberg
 """
 
-from typing import Any
+from typing import Dict, Any
 from ._internal import (
     Time, Date, DateTime, Clock, 
     is_leap, month_count
@@ -47,27 +47,26 @@ from . import scanner
 #####################################################
 
 class Module:
+    _MEMBERS: Dict[str, Any] # Filled in below, once `Module` exists.
     def __getattribute__(self, name: str) -> Any:
-        match name:
-            case "Time":
-                return Time
-            case "Date":
-                return Date
-            case "DateTime":
-                return DateTime
-            case "Clock":
-                return Clock
-            case "Module":
-                return Module
-            case "This":
-                return self
-            case "is_leap":
-                return is_leap
-            case "month_count":
-                return month_count
-            case "scanner":
-                return scanner
+        if name == "This":
+            return self
+        try:
+            return Module._MEMBERS[name]
+        except KeyError:
+            return object.__getattribute__(self, name)
     def __setattr__(self, name: str, value: Any) -> None:
         raise PermissionError("You are not allowed to change any attribute of this package.")
 
+Module._MEMBERS = {
+    "Time": Time,
+    "Date": Date,
+    "DateTime": DateTime,
+    "Clock": Clock,
+    "Module": Module,
+    "is_leap": is_leap,
+    "month_count": month_count,
+    "scanner": scanner,
+}
+
 sys.modules[__name__] = Module()
\ No newline at end of file
@@ -1,7 +1,29 @@
-from typing import Iterable, Set, Tuple, List, Dict, Optional, Generator, Any
+from typing import Iterable, Tuple, List, Dict, Optional, Generator, Any
 from .utils import is_leap, month_count
 import time as _time
 
+_monotonic = _time.monotonic
+_wallclock = _time.time
+_localtime = _time.localtime
+
+# (minute, utc offset) of the last minute converted by `_utc_offset`. The zone's 
+# offset is cached per minute, since a whole minute rarely straddles a transition.
+_offset_cache: Tuple[float, Optional[int]] = (float("nan"), None)
+
+def _utc_offset(time: float) -> Optional[int]:
+    """The local UTC offset at `time`, or None when its minute contains a zone transition."""
+    global _offset_cache
+    minute = time // 60
+    cached_minute, offset = _offset_cache
+    if minute == cached_minute:
+        return offset
+    first = minute * 60
+    offset = _localtime(first).tm_gmtoff
+    if _localtime(first + 59).tm_gmtoff != offset:
+        offset = None
+    _offset_cache = (minute, offset)
+    return offset
+
 ###########################
 # Exports:                #
 # ----------------------- #
@@ -28,13 +50,14 @@ import time as _time
 class Time:
     """
     The time lets you easily keep track of time.
+    Create it with frozen=True for a value that can't be changed, e.g. one shared between threads.
     """
     _Time__seconds: float
     _Time__frozen: bool
     __slots__ = ("_Time__seconds", "_Time__frozen")
 
-    def __init__(self, seconds: float) -> None:
-        self._Time__frozen = False
+    def __init__(self, seconds: float, frozen: bool = False) -> None:
+        self._Time__frozen = frozen
         self._Time__seconds = seconds
     
     @classmethod
@@ -43,12 +66,16 @@ class Time:
     
     @classmethod
     def from_timestamp(cls, time: float) -> "Time":
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(time)
+        offset = _utc_offset(time)
+        if offset is not None:
+            # Plain arithmetic, no struct_time to build and unpack.
+            return cls(int((time + offset) // 1) % 86400)
+        y, m, d, hh, mm, ss, weekday, jday, dst = _localtime(time)
         return cls(hh * 3600 + mm * 60 + ss)
     
     @classmethod
     def now(cls) -> "Time":
-        return Time.from_timestamp(_time.time())
+        return Time.from_timestamp(_wallclock())
     
     @property
     def days(self) -> float:
@@ -56,8 +83,9 @@ class Time:
     
     @days.setter
     def days(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value * 86400
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value * 86400
     
     @property
     def hours(self) -> float:
@@ -65,8 +93,9 @@ class Time:
     
     @hours.setter
     def hours(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value * 3600
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value * 3600
     
     @property
     def minutes(self) -> float:
@@ -74,8 +103,9 @@ class Time:
     
     @minutes.setter
     def minutes(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value * 60
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value * 60
     
     @property
     def seconds(self) -> float:
@@ -83,8 +113,9 @@ class Time:
     
     @seconds.setter
     def seconds(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value
     
     @property
     def milliseconds(self) -> float:
@@ -92,8 +123,9 @@ class Time:
     
     @milliseconds.setter
     def milliseconds(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value / 1000
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value / 1000
     
     @property
     def microseconds(self) -> float:
@@ -101,8 +133,9 @@ class Time:
     
     @microseconds.setter
     def microseconds(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value / 1000_000
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value / 1000_000
     
     @property
     def nanoseconds(self) -> float:
@@ -110,8 +143,9 @@ class Time:
     
     @nanoseconds.setter
     def nanoseconds(self, value: float) -> None:
-        if not self._Time__frozen:
-            self._Time__seconds = value / 1000_000_000
+        if self._Time__frozen:
+            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
+        self._Time__seconds = value / 1000_000_000
     
     @property
     def frozen(self) -> bool:
@@ -121,18 +155,16 @@ class Time:
         """
         Get hours, minutes and seconds in that order.
         """
-        minutes, seconds = divmod(self._Time__seconds, 60)
-        hours, minutes = divmod(minutes, 60)
-        return int(hours), int(minutes), seconds
+        total = self._Time__seconds
+        whole = int(total // 1)
+        # Integer divmod on the whole seconds; the fraction is added back at the end.
+        hours, rest = divmod(whole, 3600)
+        minutes, seconds = divmod(rest, 60)
+        return hours, minutes, seconds + (total - whole)
     
     def freeze(self) -> None:
         self._Time__frozen = True
     
-    def __setattr__(self, name: str, value: Any) -> None:
-        if hasattr(self, "_Time__frozen") and self._Time__frozen:
-            raise AttributeError("Cannot set attribute to a Time object that is frozen.")
-        super().__setattr__(name, value)
-    
     def __repr__(self) -> str:
         return f"Time({self._Time__seconds})"
     
@@ -163,21 +195,21 @@ class Date:
     _Date__frozen: bool
     __slots__ = ("_Date__year", "_Date__month", "_Date__day", "_Date__frozen")
 
-    def __init__(self, year: int, month: int, day: int) -> None:
+    def __init__(self, year: int, month: int, day: int, frozen: bool = False) -> None:
         # We trust the user with arbitrary inputs.
-        self._Date__frozen = False
+        self._Date__frozen = frozen
         self._Date__year = year
         self._Date__month = month
         self._Date__day = day
     
     @classmethod
     def from_timestamp(cls, time: float) -> "Date":
-        y, m, d, hh, mm, ss, weekday, jday, dst = _time.localtime(time)
+        y, m, d, hh, mm, ss, weekday, jday, dst = _localtime(time)
         return cls(y, m, d)
     
     @classmethod
     def today(cls) -> "Date":
-        return cls.from_timestamp(_time.time())
+        return cls.from_timestamp(_wallclock())
 
     @property
     def year(self) -> int:
@@ -185,8 +217,9 @@ class Date:
     
     @year.setter
     def year(self, value: int) -> None:
-        if not self._Date__frozen:
-            self._Date__year = value
+        if self._Date__frozen:
+            raise AttributeError("Cannot set attribute to a Date object that is frozen.")
+        self._Date__year = value
     
     @property
     def month(self) -> int:
@@ -194,8 +227,9 @@ class Date:
     
     @month.setter
     def month(self, value: int) -> None:
-        if not self._Date__frozen:
-            self._Date__month = value
+        if self._Date__frozen:
+            raise AttributeError("Cannot set attribute to a Date object that is frozen.")
+        self._Date__month = value
     
     @property
     def day(self) -> int:
@@ -203,8 +237,9 @@ class Date:
     
     @day.setter
     def day(self, value: int) -> None:
-        if not self._Date__frozen:
-            self._Date__day = value
+        if self._Date__frozen:
+            raise AttributeError("Cannot set attribute to a Date object that is frozen.")
+        self._Date__day = value
     
     @property
     def frozen(self) -> bool:
@@ -213,13 +248,8 @@ class Date:
     def freeze(self) -> None:
         self._Date__frozen = True
     
-    def __setattr__(self, name: str, value: Any) -> None:
-        if hasattr(self, "_Date__frozen") and self._Date__frozen:
-            raise AttributeError("Cannot set attribute to a Date object that is frozen.")
-        super().__setattr__(name, value)
-    
     def __repr__(self) -> str:
-        return f"Date(year={self.year} month={self.month} day={self.day})"
+        return f"Date(year={self._Date__year} month={self._Date__month} day={self._Date__day})"
     
     __str__ = __repr__
     
@@ -249,7 +279,7 @@ class DateTime:
         return self._DateTime__time
     
     def __repr__(self) -> str:
-        return f"DateTime(date={repr(self.date)} time={repr(self.time)})"
+        return f"DateTime(date={self._DateTime__date!r} time={self._DateTime__time!r})"
     
     __str__ = __repr__
     
@@ -285,7 +315,7 @@ class Event:
             return self._Due__time
         
         def __repr__(self) -> str:
-            return f"Event.Due(date={repr(self.date)} time={repr(self.time)})"
+            return f"Event.Due(date={self._Due__date!r} time={self._Due__time!r})"
         
         __str__ = __repr__
         
@@ -317,10 +347,13 @@ class Event:
     @property
     def duration(self) -> float:
         """The duration in seconds."""
-        return self.due.time.seconds - self.time.seconds if self.due else 0
+        due = self._Event__due
+        if not due:
+            return 0
+        return due._Due__time._Time__seconds - self._Event__time._Time__seconds
     
     def __repr__(self) -> str:
-        return f"Event(name={self.name} date={repr(self.date)} time={repr(self.time)} due={repr(self.due)})"
+        return f"Event(name={self._Event__name} date={self._Event__date!r} time={self._Event__time!r} due={self._Event__due!r})"
     
     __str__ = __repr__
     
@@ -338,12 +371,17 @@ class Day:
     _Day__day: int
     _Day__week: Optional["Week"]
     _Day__date: "Day.Date"
-    _Day__events: Set[Event]
-    __slots__ = ("_Day__name", "_Day__year", "_Day__month", "_Day__day", "_Day__week", "_Day__date", "_Day__events")
+    _Day__events: Dict[Event, int] # insertion-ordered set, mapping to the event's index below
+    # Each event with its start and due seconds taken when added, in parallel lists. A removal 
+    # moves the last entry into the gap, so these lists follow no particular order.
+    _Day__listed: List[Event]
+    _Day__starts: List[float]
+    _Day__dues: List[float]
+    __slots__ = ("_Day__name", "_Day__year", "_Day__month", "_Day__day", "_Day__week", "_Day__date", "_Day__events", "_Day__listed", "_Day__starts", "_Day__dues")
 
     class Date(Date):
         _Date__day_object: "Day"
-        __slots__ = ("_Date__day_object", "_Date__year", "_Date__month", "_Date__day", "_Date__frozen")
+        __slots__ = ("_Date__day_object",)
 
         def __init__(self, year: int, month: int, day: int, day_object: "Day") -> None:
             super().__init__(year, month, day)
@@ -354,14 +392,11 @@ class Day:
         
         def to_date(self) -> Date:
             """Translate the Day.Date object into a clean Date object instead."""
-            return Date(self.year, self.month, self.day)
+            return Date(self._Date__year, self._Date__month, self._Date__day)
         
         @property
         def day_object(self) -> "Day":
             return self._Date__day_object
-        
-        def __hash__(self) -> int:
-            return id(self)
 
     def __init__(self, name: str, year: int, month: int, day: int, week: Optional["Week"]) -> None:
         self._Day__name = name
@@ -370,7 +405,10 @@ class Day:
         self._Day__day = day
         self._Day__week = week
         self._Day__date = Day.Date(year, month, day, self)
-        self._Day__events = set()
+        self._Day__events = {}
+        self._Day__listed = []
+        self._Day__starts = []
+        self._Day__dues = []
     
     @property
     def name(self) -> str:
@@ -401,13 +439,49 @@ class Day:
         return list(self._Day__events)
     
     def add(self, event: Event) -> None:
-        self._Day__events.add(event)
+        events = self._Day__events
+        if event in events:
+            return
+        events[event] = len(self._Day__listed)
+        start = event._Event__time._Time__seconds
+        due = event._Event__due
+        self._Day__listed.append(event)
+        self._Day__starts.append(start)
+        self._Day__dues.append(due._Due__time._Time__seconds if due else start)
     
     def remove(self, event: Event) -> None:
-        self._Day__events.remove(event)
+        events = self._Day__events
+        index = events.pop(event)
+        listed, starts, dues = self._Day__listed, self._Day__starts, self._Day__dues
+        last, start, due = listed.pop(), starts.pop(), dues.pop()
+        if last is not event:
+            listed[index], starts[index], dues[index] = last, start, due
+            events[last] = index
     
     def clear(self) -> None:
         self._Day__events.clear()
+        self._Day__listed.clear()
+        self._Day__starts.clear()
+        self._Day__dues.clear()
+    
+    def total_duration(self) -> float:
+        """
+        The summed duration in seconds of all events, using their times as they were when added.
+        """
+        return sum(self._Day__dues) - sum(self._Day__starts)
+    
+    def has_conflicts(self) -> bool:
+        """
+        Whether any two events overlap, using their times as they were when added.
+        """
+        # Sort by start and sweep once, tracking the latest due seen so far.
+        latest = float("-inf")
+        for start, due in sorted(zip(self._Day__starts, self._Day__dues)):
+            if start < latest:
+                return True
+            if due > latest:
+                latest = due
+        return False
     
     def new_event(self, name: str, date: "Day.Date", time: Time, due: Optional[Event.Due] = None) -> Event:
         event = date.new_event(name, time, due)
@@ -421,7 +495,7 @@ class Day:
         return iter(self._Day__events)
     
     def __repr__(self) -> str:
-        return f"Day(year={self.year} month={self.month} day={self.day})"
+        return f"Day(year={self._Day__year} month={self._Day__month} day={self._Day__day})"
     
     __str__ = __repr__
     
@@ -436,7 +510,7 @@ class Week:
     _Week__number: int
     _Week__year: int
     _Week__month: int
-    _Week__days: Set[Day]
+    _Week__days: Dict[Day, None] # insertion-ordered set
     _Week__month_object: Optional["Month"]
     __slots__ = ("_Week__number", "_Week__year", "_Week__month", "_Week__days", "_Week__month_object")
 
@@ -444,7 +518,7 @@ class Week:
         self._Week__number = number
         self._Week__year = year
         self._Week__month = month
-        self._Week__days = set(days or [])
+        self._Week__days = {} if days is None else dict.fromkeys(days)
         self._Week__month_object = month_object
     
     @property
@@ -468,10 +542,10 @@ class Week:
         return list(self._Week__days)
     
     def add(self, day: Day) -> None:
-        self._Week__days.add(day)
+        self._Week__days[day] = None
     
     def remove(self, day: Day) -> None:
-        self._Week__days.remove(day)
+        del self._Week__days[day]
     
     def clear(self) -> None:
         self._Week__days.clear()
@@ -485,10 +559,10 @@ class Week:
         yield from self._Week__days
     
     def to_dict_name(self) -> Dict[str, Day]:
-        return {day.name: day for day in self._Week__days}
+        return {day._Day__name: day for day in self._Week__days}
     
     def to_dict_day(self) -> Dict[int, Day]:
-        return {day.day: day for day in self._Week__days}
+        return {day._Day__day: day for day in self._Week__days}
     
     def __iter__(self) -> Iterable[Day]:
         return iter(self._Week__days)
@@ -504,21 +578,27 @@ class Month:
     _Month__name: str
     _Month__year: int
     _Month__month: int
-    _Month__weeks: Set[Week]
+    _Month__weeks: Dict[Week, None] # insertion-ordered set
     _Month__year_object: Optional["Year"]
-    __slots__ = ("_Month__name", "_Month__year", "_Month__month", "_Month__weeks", "_Month__year_object")
+    _Month__supposed_count: Optional[Tuple[int, int]]
+    __slots__ = ("_Month__name", "_Month__year", "_Month__month", "_Month__weeks", "_Month__year_object", "_Month__supposed_count")
     
     def __init__(self, name: str, year: int, month: int, year_object: Optional["Year"] = None) -> None:
         self._Month__name = name
         self._Month__year = year
         self._Month__month = month
-        self._Month__weeks = set()
+        self._Month__weeks = {}
         self._Month__year_object = year_object
+        self._Month__supposed_count = None
     
     @property
     def supposed_count(self) -> Tuple[int, int]:
         """Return (first_weekday, number_of_days) for the given month."""
-        return month_count(self._Month__year, self._Month__month)
+        # Year and month never change, so this is computed once.
+        count = self._Month__supposed_count
+        if count is None:
+            count = self._Month__supposed_count = month_count(self._Month__year, self._Month__month)
+        return count
     
     @property
     def year_object(self) -> Optional["Year"]:
@@ -541,10 +621,10 @@ class Month:
         return list(self._Month__weeks)
     
     def add(self, week: Week) -> None:
-        self._Month__weeks.add(week)
+        self._Month__weeks[week] = None
     
     def remove(self, week: Week) -> None:
-        self._Month__weeks.remove(week)
+        del self._Month__weeks[week]
     
     def clear(self) -> None:
         self._Month__weeks.clear()
@@ -569,16 +649,22 @@ class Year:
     A year will contain different months.
     """
     _Year__year: int
-    _Year__months: Set[Month]
-    __slots__ = ("_Year__year", "_Year__months")
+    _Year__months: Dict[Month, None] # insertion-ordered set
+    _Year__is_leap: Optional[bool]
+    __slots__ = ("_Year__year", "_Year__months", "_Year__is_leap")
 
     def __init__(self, year: int, months: Optional[List[Month]] = None) -> None:
         self._Year__year = year
-        self._Year__months = set(months or [])
+        self._Year__months = {} if months is None else dict.fromkeys(months)
+        self._Year__is_leap = None
     
     @property
     def is_leap(self) -> bool:
-        return is_leap(self._Year__year)
+        # The year never changes, so this is computed once.
+        leap = self._Year__is_leap
+        if leap is None:
+            leap = self._Year__is_leap = is_leap(self._Year__year)
+        return leap
     
     @property
     def year(self) -> int:
@@ -589,10 +675,10 @@ class Year:
         return list(self._Year__months)
     
     def add(self, month: Month) -> None:
-        self._Year__months.add(month)
+        self._Year__months[month] = None
     
     def remove(self, month: Month) -> None:
-        self._Year__months.remove(month)
+        del self._Year__months[month]
     
     def clear(self) -> None:
         self._Year__months.clear()
@@ -606,10 +692,10 @@ class Year:
         yield from self._Year__months
     
     def to_dict_name(self) -> Dict[str, Month]:
-        return {month.name: month for month in self._Year__months}
+        return {month._Month__name: month for month in self._Year__months}
     
     def to_dict_month(self) -> Dict[int, Month]:
-        return {month.month: month for month in self._Year__months}
+        return {month._Month__month: month for month in self._Year__months}
     
     def __iter__(self) -> Iterable[Month]:
         return iter(self._Year__months)
@@ -627,7 +713,7 @@ class Clock:
     __slots__ = ("_Clock__start",)
 
     def __init__(self, start: Optional[float] = None) -> None:
-        self._Clock__start = start or _time.monotonic()
+        self._Clock__start = start or _monotonic()
     
     @property
     def start_time(self) -> float:
@@ -637,20 +723,26 @@ class Clock:
     @property
     def day(self) -> int:
         """Day counter."""
-        now = self.now()
-        return int(now / 86400)
+        return self.split_day()[0]
 
     @property
     def seconds(self) -> float:
         """Seconds into the day."""
+        return self.split_day()[1]
+    
+    def split_day(self) -> Tuple[int, float]:
+        """
+        Day counter and seconds into that day, from a single read of the clock.
+        """
         now = self.now()
-        return now - int(now / 86400)
+        day = int(now // 86400)
+        return day, now - day * 86400
     
     def now(self) -> float:
         """
         Monotonic current time. Since this object was created, or the start time specified.
         """
-        return _time.monotonic() - self._Clock__start
+        return _monotonic() - self._Clock__start
     
     @staticmethod
     def today() -> Date:
@@ -662,7 +754,7 @@ class Clock:
         Return the current time in seconds since the Epoch. 
         Fractions of a second may be present if the system clock provides them.
         """
-        return _time.time()
+        return _wallclock()
 
     @staticmethod
     def new_time(seconds: float) -> Time:
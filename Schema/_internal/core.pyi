@@ -8,7 +8,7 @@ __all__ = (
 )
 
 class Time:
-    def __init__(self, seconds: float) -> None: ...
+    def __init__(self, seconds: float, frozen: bool = False) -> None: ...
     @classmethod
     def from_units(cls, hours: int = 0, minutes: int = 0, seconds: float = 0.0) -> "Time": ...
     @classmethod
@@ -50,7 +50,7 @@ class Time:
 
 
 class Date:
-    def __init__(self, year: int, month: int, day: int) -> None: ...
+    def __init__(self, year: int, month: int, day: int, frozen: bool = False) -> None: ...
     @classmethod
     def from_timestamp(cls, time: float) -> "Date": ...
     @classmethod
@@ -127,6 +127,8 @@ class Day:
     def add(self, event: Event) -> None: ...
     def remove(self, event: Event) -> None: ...
     def clear(self) -> None: ...
+    def total_duration(self) -> float: ...
+    def has_conflicts(self) -> bool: ...
     def new_event(self, name: str, date: "Day.Date", time: Time, due: Optional[Event.Due] = None) -> Event: ...
     def iterate(self) -> Generator[Event, Any, None]: ...
     def __iter__(self) -> Iterable[Event]: ...
@@ -202,6 +204,7 @@ class Clock:
     def day(self) -> int: ...
     @property
     def seconds(self) -> float: ...
+    def split_day(self) -> Tuple[int, float]: ...
     def now(self) -> float: ...
     @staticmethod
     def today() -> Date: ...
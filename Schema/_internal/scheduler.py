@@ -1,21 +1,26 @@
-from typing import Tuple, Dict, Callable, Optional, Any
+from typing import Tuple, List, Dict, Callable, Optional, Any
 from .core import Time, Clock as _Clock
+from functools import partial
+import itertools
 import threading
-import time as _time
+import heapq
 
 class Callback:
     _Callback__target: Callable
     _Callback__args: Tuple
     _Callback__kwargs: Dict[str, Any]
-    __slots__ = ("_Callback__target", "_Callback__args", "_Callback__kwargs")
+    _Callback__fire: Callable[[], Any]
+    __slots__ = ("_Callback__target", "_Callback__args", "_Callback__kwargs", "_Callback__fire")
 
     def __init__(self, target: Callable, args: Optional[Tuple] = None, kwargs: Optional[Dict[str, Any]] = None) -> None:
         self._Callback__target = target
-        self._Callback__args = args or ()
-        self._Callback__kwargs = kwargs or {}
+        self._Callback__args = args = args or ()
+        self._Callback__kwargs = kwargs = kwargs or {}
+        # Bind the arguments once, so firing is a single call.
+        self._Callback__fire = partial(target, *args, **kwargs) if args or kwargs else target
     
     def __call__(self) -> Any:
-        return self._Callback__target(*self._Callback__args, **self._Callback__kwargs)
+        return self._Callback__fire()
 
 class Clock(_Clock):
     """
@@ -29,23 +34,34 @@ class Clock(_Clock):
     object, or update it with that same time object. But, as the time is the object, you can also have 
     multiple time objects for the same given time.
 
-    Note! You must save the Time object to remove or update the callback.
+    Note! You must save the Time object to remove or update the callback. The deadline is read 
+    from the Time object when the callback is set; changing the Time afterwards has no effect 
+    until you set the callback again.
 
     The thread will not join, since it will be stopped before we even reach it. If you want to be sure 
     that it is joined, try stop_thread.
     """
 
-    interval: int = 1
+    interval: float = 1
 
-    _Clock__callbacks: Dict[Time, Callback]
+    # The callbacks dict is the source of truth. The heap orders deadlines, so a tick only 
+    # looks at what is due; its entries are dropped lazily once their sequence number no 
+    # longer matches the callbacks dict (removed or replaced).
+    _Clock__callbacks: Dict[Time, Tuple[int, float, Callback]] # time -> (sequence, deadline, callback)
+    _Clock__heap: List[Tuple[float, int, Time]] # (deadline, sequence, time)
+    _Clock__sequence: "itertools.count[int]"
+    _Clock__condition: threading.Condition
     _Clock__active: threading.Event
     _Clock__thread: Optional[threading.Thread]
     _Clock__last_tick: int
-    __slots__ = _Clock.__slots__ + ("_Clock__callbacks", "_Clock__active", "_Clock__thread", "_Clock__last_tick")
+    __slots__ = ("_Clock__callbacks", "_Clock__heap", "_Clock__sequence", "_Clock__condition", "_Clock__active", "_Clock__thread", "_Clock__last_tick")
 
     def __init__(self, start: Optional[float] = None) -> None:
         super().__init__(start)
         self._Clock__callbacks = {}
+        self._Clock__heap = []
+        self._Clock__sequence = itertools.count()
+        self._Clock__condition = threading.Condition(threading.Lock())
         self._Clock__active = threading.Event()
         self._Clock__thread = None
         self._Clock__last_tick = -1
@@ -54,26 +70,60 @@ class Clock(_Clock):
     def callbacks_active(self) -> bool:
         return self._Clock__active.is_set()
     
+    def __next_wait(self) -> Optional[float]:
+        # Sleep until the next deadline, but never before the next tick since update_schedule 
+        # processes each tick once only. None means nothing is pending: wait for a notify.
+        heap = self._Clock__heap
+        if not heap:
+            return None
+        due = max(heap[0][0], (self._Clock__last_tick + 1) * self.interval)
+        return max(0.0, due - self.now())
+    
     def __loop(self) -> None:
-        while self._Clock__active.is_set():
+        condition = self._Clock__condition
+        is_set = self._Clock__active.is_set
+        update = self.update_schedule
+        next_wait = self.__next_wait
+        wait = condition.wait
+        while is_set():
             try:
-                self.update_schedule()
+                update()
             except Exception:
                 # swallow to avoid killing the thread; consider logging
                 pass
-            _time.sleep(0.1)
+            with condition:
+                if not is_set():
+                    break
+                wait(next_wait())
     
     def set_callback(self, time: Time, callback: Callback) -> None:
-        self._Clock__callbacks[time] = callback
+        with self._Clock__condition:
+            sequence = next(self._Clock__sequence)
+            deadline = time._Time__seconds
+            self._Clock__callbacks[time] = (sequence, deadline, callback)
+            heapq.heappush(self._Clock__heap, (deadline, sequence, time))
+            self._Clock__condition.notify()
     
     def remove_callback(self, time: Time) -> None:
-        self._Clock__callbacks.pop(time, None)
+        with self._Clock__condition:
+            if self._Clock__callbacks.pop(time, None) is None:
+                return
+            # Lazy deletion; rebuild once stale entries dominate the heap.
+            if len(self._Clock__heap) > 2 * len(self._Clock__callbacks) + 16:
+                self._Clock__heap = [
+                    (deadline, sequence, t) 
+                    for t, (sequence, deadline, _) in self._Clock__callbacks.items()
+                ]
+                heapq.heapify(self._Clock__heap)
+            self._Clock__condition.notify()
     
     def has_callback(self, time: Time) -> bool:
         return time in self._Clock__callbacks
     
     def clear_callbacks(self) -> None:
-        self._Clock__callbacks.clear()
+        with self._Clock__condition:
+            self._Clock__callbacks.clear()
+            self._Clock__heap.clear()
     
     def start_schedule(self, daemon: bool = False) -> None:
         if self._Clock__active.is_set(): return
@@ -85,21 +135,30 @@ class Clock(_Clock):
         now = self.now()
 
         # compute tick index: how many full 'interval' seconds have passed
-        tick = int(now) // int(self.interval)
+        tick = int(now // self.interval)
         # process each tick once only
         if tick == self._Clock__last_tick:
             return
         self._Clock__last_tick = tick
 
-        for t, callback in self._Clock__callbacks.copy().items():
-            if now >= t.seconds: 
-                try:
-                    callback()
-                finally:
-                    self.remove_callback(t)
+        # Pop only what is due, O(log n) each, instead of scanning every callback.
+        heap = self._Clock__heap
+        callbacks = self._Clock__callbacks
+        while True:
+            with self._Clock__condition:
+                if not heap or heap[0][0] > now:
+                    return
+                deadline, sequence, t = heapq.heappop(heap)
+                entry = callbacks.get(t)
+                if entry is None or entry[0] != sequence:
+                    continue # removed or replaced since it was pushed
+                del callbacks[t]
+            entry[2]()
     
     def stop_schedule(self) -> None:
         self._Clock__active.clear()
+        with self._Clock__condition:
+            self._Clock__condition.notify_all()
         # We should not join the thread since the exit is so fast to even bother!
     
     def stop_thread(self, join_timeout: Optional[float] = None) -> None:
@@ -109,8 +168,9 @@ class Clock(_Clock):
     
     def wait_for_scheduler(self) -> None:
         """Block the current thread until the sheduler has stopped."""
-        while self._Clock__active.is_set():
-            _time.sleep(0.1)
+        with self._Clock__condition:
+            while self._Clock__active.is_set():
+                self._Clock__condition.wait()
     
     @staticmethod
     def new_callback(target: Callable, args: Optional[Tuple] = None, kwargs: Optional[Dict[str, Any]] = None) -> Callback:
@@ -7,7 +7,7 @@ class Callback:
 
 
 class Clock(_Clock):
-    interval: int
+    interval: float
     def __init__(self, start: Optional[float] = None) -> None: ...
     @property
     def callbacks_active(self) -> bool: ...
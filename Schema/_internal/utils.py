@@ -1,11 +1,25 @@
 from typing import Tuple
-import calendar
+from functools import lru_cache
 
+# Days per month in a common year.
+_MONTH_DAYS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+@lru_cache(maxsize=1024)
 def is_leap(year: int) -> bool:
     """Wheter the given year is a leap year."""
     return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
 
+@lru_cache(maxsize=4096)
 def month_count(year: int, month: int) -> Tuple[int, int]:
     """Return (first_weekday, number_of_days) for the given month."""
     assert 1 <= month <= 12, month
-    return calendar.monthrange(year, month)
\ No newline at end of file
+    days = _MONTH_DAYS[month - 1]
+    if month == 2 and is_leap(year):
+        days = 29
+    # Zeller's congruence for the 1st (0 = Saturday), January and February counted 
+    # as months 13 and 14 of the previous year.
+    if month < 3:
+        year -= 1
+        month += 12
+    h = (1 + 13 * (month + 1) // 5 + year + year // 4 - year // 100 + year // 400) % 7
+    return (h + 5) % 7, days # Monday = 0, as calendar.monthrange
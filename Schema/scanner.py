@@ -13,11 +13,12 @@ certain parts of your code.
 """
 
 from typing import (
-    Set, List, Dict, Callable, ParamSpec, TypeVar, 
+    List, Dict, Tuple, Callable, ParamSpec, TypeVar, 
     Union, Optional, Any
 )
 from dataclasses import dataclass
 import threading
+import time
 import Schema
 
 P = ParamSpec("P")
@@ -50,20 +51,45 @@ class PendingResolve:
     """
     def __init__(self) -> None:
         self._event = threading.Event()
-        self.resolve: Optional[Resolve] = None
+        self._resolve: Optional[Resolve] = None
+        # The raw (time, start, end, function, resolution, exception) of the last scheduled 
+        # call, only wrapped into a Resolve with Time objects once `resolve` is read.
+        self._call: Optional[Tuple[Schema.Time, float, float, Callable[..., Any], Any, Optional[BaseException]]] = None
         self.function: Optional[Callable] = None
-        self.args: Optional[List[Any]] = None
+        self.args: Optional[Tuple[Any, ...]] = None
         self.kwargs: Optional[Dict[str, Any]] = None
         self.expected: bool = True
         self.total_duration: float = 0
         self.called_count: int = 0
 
+    @property
+    def resolve(self) -> Optional[Resolve]:
+        call = self._call
+        if call is not None:
+            time, start, end, function, resolution, exception = call
+            self._resolve = Resolve(time, Schema.Time(start), Schema.Time(end), function, resolution, exception)
+            self._call = None
+        return self._resolve
+
+    @resolve.setter
+    def resolve(self, resolve: Optional[Resolve]) -> None:
+        self._call = None
+        self._resolve = resolve
+
     def set_resolve(self, resolve: Resolve) -> None:
         self.resolve = resolve
         self.total_duration += resolve.duration
         self.called_count += 1
         self._event.set()
 
+    def _set_call(self, time: Schema.Time, start: float, end: float, function: Callable[..., Any], 
+                  resolution: Any, exception: Optional[BaseException]) -> None:
+        # Like `set_resolve`, but from raw clock seconds, so the scheduled call builds no objects.
+        self._call = (time, start, end, function, resolution, exception)
+        self.total_duration += end - start
+        self.called_count += 1
+        self._event.set()
+
     def wait(self, timeout: Optional[float] = None) -> Optional[Resolve]:
         """
         Wait until resolved. If timeout is None, wait indefinitely.
@@ -87,7 +113,7 @@ class Overview:
     Manages scheduled callbacks on a Schema.Clock and tracks PendingResolve objects.
     """
     def __init__(self, clock: Schema.Clock) -> None:
-        self._ids: Set[Schema.Time] = set()
+        self._pending: Dict[Schema.Time, Any] = {} # scheduled time -> clock callback
         self.clock = clock
         self.resolves: List[PendingResolve] = []
         self.active = True
@@ -104,38 +130,41 @@ class Overview:
 
         def decorator(func: Callable[P, T]) -> PendingResolve:
             pending = PendingResolve()
+            # resolved once here, not on every call
+            clock = self.clock
 
             def method(*a: P.args, **kw: P.kwargs) -> T:
-                # record start and end around the actual call
-                start = Schema.Time(self.clock.seconds)
+                # record raw start and end seconds around the actual call; no Time is built here
+                start = clock.seconds
                 exc = None
                 try:
                     result = func(*a, **kw)
                 except Exception as e:
                     exc = e
                     result = None
-                end = Schema.Time(self.clock.seconds)
-                pending.set_resolve(Resolve(when_time, start, end, func, result, exc))
+                end = clock.seconds
+                pending._set_call(when_time, start, end, func, result, exc)
                 if exc:
                     raise exc
                 return result
             
             # Make the PendingResolve call the wrapper that sets the Resolve
             pending.function = method
-            pending.args = list(args)
-            pending.kwargs = dict(kwargs)
-
-            # register id and schedule callback
-            with self._lock:
-                self._ids.add(when_time)
+            # both are fresh containers from this call's packing, so no copies are needed
+            pending.args = args
+            pending.kwargs = kwargs
 
+            # schedule and register the callback
             if not when_time.seconds == -1.0:
                 callback = self.clock.new_callback(
                     target=method,
                     args=args,
                     kwargs=kwargs,
                 )
-                self.clock.set_callback(when_time, callback)
+                # registered and scheduled together, so a concurrent `end` cancels both or neither
+                with self._lock:
+                    self._pending[when_time] = callback
+                    self.clock.set_callback(when_time, callback)
             else: pending.expected = False
             return pending
 
@@ -149,10 +178,10 @@ class Overview:
     def end(self) -> None:
         """Stop scheduled callbacks and try to stop the clock thread."""
         with self._lock:
-            for t in list(self._ids):
-                if self.clock.has_callback(t):
-                    self.clock.remove_callback(t)
-            self._ids.clear()
+            pending, self._pending = self._pending, {}
+            # removing a callback that already ran is a no-op, so no has_callback probe
+            for t in pending:
+                self.clock.remove_callback(t)
 
         # stop scheduling machinery on the clock (best-effort)
         try:
@@ -170,11 +199,12 @@ class Overview:
     def wait_all(self, timeout: Optional[float] = None) -> List[Optional[Resolve]]:
         """
         Wait for all tracked resolves to finish. If timeout is provided, wait up
-        to that many seconds for each item (not total).
+        to that many seconds in total, not for each item.
         """
+        deadline = None if timeout is None else time.monotonic() + timeout
         results: List[Optional[Resolve]] = []
         for p in list(self.resolves):
-            results.append(p.wait(timeout))
+            results.append(p.wait(None if deadline is None else max(0.0, deadline - time.monotonic())))
         return results
 
 
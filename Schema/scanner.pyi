@@ -1,5 +1,5 @@
 from typing import (
-    List, Dict, Callable, ParamSpec, TypeVar, 
+    List, Dict, Tuple, Callable, ParamSpec, TypeVar, 
     Union, Optional, Any
 )
 from dataclasses import dataclass
@@ -31,7 +31,7 @@ class PendingResolve:
     Uses threading.Event to provide an efficient wait() implementation.
     """
     resolve: Resolve
-    args: List[Any]
+    args: Tuple[Any, ...]
     kwargs: Dict[str, Any]
     total_duration: float
     called_count: int
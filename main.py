@@ -2,26 +2,38 @@ import Performance
 import time
 
 PRINT_COUNT = 100000
-text_length = 0
+
+# The text only changes once a second or once a percent; reuse it until then.
+_last_key = None
+_last_text = ""
 
 @Performance.inspect
 def generate_text(x: int) -> str:
-    return f"Performance control: {int(time.perf_counter())} ({int(x*100/PRINT_COUNT)}%)"
+    global _last_key, _last_text
+    key = (int(time.perf_counter()), x*100//PRINT_COUNT)
+    if key != _last_key:
+        _last_key = key
+        _last_text = f"Performance control: {key[0]} ({key[1]}%)"
+    return _last_text
 
-@Performance.inspect
-def add_length(t: str) -> None:
-    global text_length
-    text_length = len(t)
+@Performance.sample(1000)
+def add_length(t: str) -> int:
+    return len(t)
 
 @Performance.inspect
-def print_time(x: int) -> None:
+def print_time(x: int) -> int:
     text = generate_text(x)
     print(text,end="\r")
-    add_length(text)
+    return add_length(text)
 
-for i in range(PRINT_COUNT):
-    print_time(i)
+def print_all() -> int:
+    # The length is kept in a local; only the last one is needed.
+    text_length = 0
+    for i in range(PRINT_COUNT):
+        text_length = print_time(i)
+    return text_length
 
+text_length = print_all()
 print(" "*text_length, end="\r")
 Performance.print_total_log()
 print()
@@ -6,14 +6,34 @@ randomizing, allowing full performance and new capabilities.
 This extention also streamlines making randomized objects.
 """
 
-from typing import Iterable, Optional, Union, TypeVar, Generic, Any
+from typing import Iterable, Dict, Optional, Union, TypeVar, Generic, Any
 from dataclasses import dataclass
+import itertools
 import wrapper
 import random
 
 T = TypeVar("T")
 RandomOrX = Union["Random", "random.Random", int]
 
+# Per value type: True to choose from it, False to scale by it, None for neither. 
+# Decided once per type, since isinstance against Iterable is an ABC check.
+_choose_from: Dict[type, Optional[bool]] = {}
+
+def _chooses_from(value: Any) -> Optional[bool]:
+    typ = type(value)
+    try:
+        return _choose_from[typ]
+    except KeyError:
+        pass
+    if isinstance(value, Iterable):
+        kind = True
+    elif isinstance(value, (int, float)):
+        kind = False
+    else:
+        kind = None
+    _choose_from[typ] = kind
+    return kind
+
 @dataclass
 class ObjectDef(Generic[T]):
     value: T
@@ -32,9 +52,10 @@ class ObjectDef(Generic[T]):
     def random(definition: "Object", random_or_x: Optional[RandomOrX] = None) -> Union[Any, float]:
         random = definition._get_random(random_or_x)
         value = definition.value
-        if isinstance(value, Iterable):
+        kind = _chooses_from(value)
+        if kind:
             return random.choice(value)
-        elif isinstance(value, (int, float)):
+        elif kind is False:
             return random.random() * value
     
     @wrapper.threaded
@@ -56,19 +77,20 @@ class Object(ObjectDef[T]):
         return Object(self.value, self.chance)
 
 class AbsoluteObject(Object[T]):
+    # Absolute results are waited for anyway, so skip the thread and the resolve.
     def random(self, random_or_x: Optional[RandomOrX] = None) -> Union[Any, float]:
-        return Object.random(self, random_or_x).result()
+        return ObjectDef.random.direct_call(self, random_or_x)
     def random_int(self, random_or_x: Optional[RandomOrX] = None) -> int:
-        return Object.random_int(self, random_or_x).result()
+        return ObjectDef.random_int.direct_call(self, random_or_x)
 
 class RandomWrapper(wrapper.Wrapper):
-    def __init__(self) -> None:
-        super().__init__()
+    pass
 
 @wrapper.wrap(wrapper=RandomWrapper)
 class RandomDef:
-    def __init__(self, x: Optional[int] = None) -> None:
+    def __init__(self, x: Optional[int] = None, threaded: bool = True) -> None:
         self._random = random.Random(x)
+        self._threaded = threaded
     
     @property
     def object(self) -> random.Random:
@@ -86,8 +108,7 @@ class RandomDef:
     def randobj(definition: "Random", *args: Object, items: Optional[Iterable[Object]] = None) -> Any:
         real = []
         chance = []
-        items = list(items or []) + list(args)
-        for item in items:
+        for item in itertools.chain(items or (), args):
             if item is None:
                 continue
             real.append(item.value)
@@ -96,20 +117,37 @@ class RandomDef:
     
     @wrapper.threaded
     def choice(definition: "Random", *args: Any, items: Optional[Iterable[Any]] = None) -> Any:
-        return definition._random.choice(list(items or []) + list(args))
+        # Pick an index across items then args instead of concatenating them; 
+        # randrange(n) draws exactly like choice on a sequence of length n.
+        if items is None:
+            items = ()
+        elif not isinstance(items, (list, tuple)):
+            items = list(items)
+        count = len(items)
+        total = count + len(args)
+        if not total:
+            raise IndexError("Cannot choose from an empty sequence")
+        index = definition._random.randrange(total)
+        return items[index] if index < count else args[index - count]
 
 class Random(RandomDef):
+    def _call(self, method: wrapper.ThreadedMethod, *args: Any, **kwargs: Any) -> wrapper.Resolve[Any]:
+        # Random(threaded=False) runs in the calling thread, still returning a resolve.
+        if self._threaded:
+            return method(self, *args, **kwargs)
+        return method.sync_call(self, *args, **kwargs)
+
     def random(self) -> wrapper.Resolve[float]:
-        return RandomDef.random(self)
+        return self._call(RandomDef.random)
     
     def randint(self, a: int, b: int) -> wrapper.Resolve[int]:
-        return RandomDef.randint(self, a, b)
+        return self._call(RandomDef.randint, a, b)
     
     def randobj(self, *args: Object, items: Optional[Iterable[Object]] = None) -> wrapper.Resolve[Any]:
-        return RandomDef.randobj(self, *args, items=items)
+        return self._call(RandomDef.randobj, *args, items=items)
     
     def choice(self, *args: Any, items: Optional[Iterable[Any]] = None) -> wrapper.Resolve[Any]:
-        return RandomDef.choice(self, *args, items=items)
+        return self._call(RandomDef.choice, *args, items=items)
 
     @staticmethod
     def prep(item: Any, chance: Optional[float] = None) -> Object:
@@ -120,11 +158,12 @@ class Random(RandomDef):
         wrapper.cleanup()
 
 class AbsoluteRandom(Random):
+    # Absolute results are waited for anyway, so skip the thread and the resolve.
     def random(self) -> float:
-        return Random.random(self).result()
+        return RandomDef.random.direct_call(self)
     def randint(self, a: int, b: int) -> int:
-        return Random.randint(self, a, b).result()
+        return RandomDef.randint.direct_call(self, a, b)
     def randobj(self, *args: Object, items: Optional[Iterable[Object]] = None) -> Any:
-        return Random.randobj(self, *args, items=items).result()
+        return RandomDef.randobj.direct_call(self, *args, items=items)
     def choice(self, *args: Any, items: Optional[Iterable[Any]] = None) -> Any:
-        return Random.choice(self, *args, items=items).result()
\ No newline at end of file
+        return RandomDef.choice.direct_call(self, *args, items=items)
\ No newline at end of file
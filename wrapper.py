@@ -3,11 +3,12 @@ The wrapper util is a simple script that provides threading and wrapping.
 For a good cleanup, you have to call `cleanup` when you are done.
 """
 
-from typing import List, Optional, Union, Callable, Generator, Type, TypeVar, ParamSpec, Generic, Final, Any
+from typing import List, Dict, Tuple, Optional, Union, Callable, Generator, Type, TypeVar, ParamSpec, Generic, Final, Any
 from contextlib import contextmanager
 from types import new_class
 import weakref
 import threading
+import queue
 import functools
 import time
 import sys
@@ -21,30 +22,74 @@ P2 = ParamSpec("P2")
 # single-instance sentinel (use instance, not class)
 MISSING: Final = object()
 
-_threads: List[threading.Thread] = []
-_resolves: weakref.WeakSet["Resolve"] = weakref.WeakSet()
-_threaded_methods: weakref.WeakSet["ThreadedMethod"] = weakref.WeakSet()
+_threads: weakref.WeakSet[threading.Thread] = weakref.WeakSet() # running threads are kept alive by threading
+_threaded_methods: weakref.WeakSet["ThreadedMethod"] = weakref.WeakSet() # only those with own threads
 
 def new_basic_thread(target: Callable[..., Any], *args: Any, **kwargs: Any) -> threading.Thread:
     """Create a thread and register it; do not start it here (caller decides)."""
     thread = threading.Thread(target=target, args=args, kwargs=kwargs)
-    _threads.append(thread)
+    _threads.add(thread)
     return thread
 
+# Daemon workers reused across threaded calls. An idle worker parks on its own queue; a call is 
+# handed to an idle worker or gets a new one, so calls never wait on each other (no fixed size).
+_Task = Tuple[Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+_POOL_IDLE_TIMEOUT: Final = 60.0 # seconds an idle worker waits before exiting
+_pool_lock = threading.Lock()
+_pool_finished = threading.Condition(_pool_lock)
+_pool_idle: List["queue.SimpleQueue[_Task]"] = []
+_pool_pending = 0
+
+def _pool_worker(tasks: "queue.SimpleQueue[_Task]", task: _Task) -> None:
+    global _pool_pending
+    while True:
+        target, args, kwargs = task
+        try:
+            target(*args, **kwargs)
+        except BaseException:
+            # reported like a failure in a thread of its own, but the worker is kept
+            threading.excepthook(threading.ExceptHookArgs((*sys.exc_info(), threading.current_thread())))
+        finally:
+            with _pool_lock:
+                _pool_pending -= 1
+                if not _pool_pending:
+                    _pool_finished.notify_all()
+                _pool_idle.append(tasks)
+        try:
+            task = tasks.get(timeout=_POOL_IDLE_TIMEOUT)
+        except queue.Empty:
+            with _pool_lock:
+                if tasks in _pool_idle:
+                    _pool_idle.remove(tasks)
+                    return
+            task = tasks.get() # handed a task right as we timed out
+
+def _pool_submit(target: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    global _pool_pending
+    task = (target, args, kwargs)
+    with _pool_lock:
+        _pool_pending += 1
+        if _pool_idle:
+            _pool_idle.pop().put(task)
+            return
+    tasks: "queue.SimpleQueue[_Task]" = queue.SimpleQueue()
+    threading.Thread(target=_pool_worker, args=(tasks, task), daemon=True).start()
+
+def _pool_wait(timeout: Optional[float] = None) -> bool:
+    with _pool_lock:
+        return _pool_finished.wait_for(lambda: not _pool_pending, timeout)
+
 class Resolve(Generic[T3]):
-    __slots__ = ("_threaded_method", "_watch_thread", "_lock", "_rlock", "_event", "_value", "_exc", "_exc_tb", "__weakref__")
+    __slots__ = ("_threaded_method", "_cond", "_value", "_exc", "_exc_tb", "__weakref__")
 
     def __init__(self, threaded_method: "ThreadedMethod"):
-        # use object.__setattr__ to bypass our __setattr__
-        object.__setattr__(self, "_threaded_method", threaded_method)
-        object.__setattr__(self, "_watch_thread", threading.Thread(target=self._watcher, kwargs={"capture": True}, daemon=True))
-        object.__setattr__(self, "_lock", threading.Lock())
-        object.__setattr__(self, "_rlock", threading.RLock())
-        object.__setattr__(self, "_event", threading.Event())
-        object.__setattr__(self, "_value", MISSING)
-        object.__setattr__(self, "_exc", None)
-        object.__setattr__(self, "_exc_tb", None)
-        _resolves.add(self)
+        # state is private by convention; the slots only ever hold these fields
+        self._threaded_method = threaded_method
+        # one condition (over an RLock) guards the state and signals completion
+        self._cond = threading.Condition()
+        self._value = MISSING
+        self._exc = None
+        self._exc_tb = None
 
     # read-only accessors
     @property
@@ -53,37 +98,45 @@ class Resolve(Generic[T3]):
 
     @property
     def done(self) -> bool:
-        return self._event.is_set()
+        return self._value is not MISSING or self._exc is not None
 
+    # Readers take no lock: the value is published by a single attribute store, and 
+    # the condition is only needed by writers to notify waiters.
     @property
     def value(self) -> Optional[T3]:
-        with self._lock:
-            return None if self._value is MISSING else self._value  # Optional[T3]
+        value = self._value
+        return None if value is MISSING else value  # Optional[T3]
     
     @property
     def has_value(self) -> bool:
-        with self._lock:
-            return self._value is not MISSING and self.done
+        return self._value is not MISSING
 
     # internal setters used by the worker
     def _set_value(self, value: T3) -> None:
-        with self._lock:
-            object.__setattr__(self, "_value", value)
-            object.__setattr__(self, "_exc", None)
-            self._event.set()
+        with self._cond:
+            self._value = value
+            self._exc = None
+            self._cond.notify_all()
 
     def _set_exception(self, exc: BaseException) -> None:
-        with self._lock:
+        with self._cond:
             tb = getattr(exc, "__traceback__", None)
             if tb is None:
                 tb = sys.exc_info()[2]
-            object.__setattr__(self, "_exc", exc)
-            object.__setattr__(self, "_exc_tb", tb)
-            self._event.set()
+            self._exc_tb = tb # before the exception, which is what lock-free readers check
+            self._exc = exc
+            self._cond.notify_all()
+    
+    # The properties stay the public read-only API; internal paths read the slots directly.
+    def _wait_done(self, timeout: Optional[float]) -> bool:
+        if self._value is not MISSING or self._exc is not None:
+            return True
+        with self._cond:
+            return self._cond.wait_for(lambda: self._value is not MISSING or self._exc is not None, timeout)
     
     def _raise(self) -> None:
         exc = self._exc
-        tb = getattr(self, "_exc_tb", None)
+        tb = self._exc_tb
         if exc is None:
             return
         # Prefer re-raising original exception with original traceback
@@ -91,51 +144,50 @@ class Resolve(Generic[T3]):
             raise exc.with_traceback(tb)
         raise exc
 
-    # External API to start a watcher thread that will capture parent result when ready.
+    # External API to capture the parent result when ready. No watcher thread: the resolve is 
+    # registered on the parent, and its runner publishes to it when the call completes.
     def start_recording(self) -> None:
         """Start recording the result, whenever it occures. You can only call this once."""
-        if not self._watch_thread.is_alive():
-            self._watch_thread.start()
+        if self.done:
+            return
+        parent = self._threaded_method
+        with parent._lock:
+            if parent.complete and parent._last_result is not MISSING:
+                self._set_value(parent._last_result)
+            elif self not in parent._recorders:
+                parent._recorders.append(self)
 
     # capture attempt (non-blocking) -- returns captured value or None
     def capture(self) -> Optional[T3]:
         """Capture the result in this very moment."""
         # Prefer our own captured state (per-call). If exception present, raise it.
-        with self._rlock:
-            if self._exc is not None:
-                self._raise()
-            if self._value is not MISSING:
-                return self._value
+        if self._exc is not None:
+            self._raise()
+        value = self._value
+        if value is not MISSING:
+            return value
 
         # Backwards-compat: if parent has a last-result and we haven't been set yet,
         # adopt it. (Note: parent._result is *last* run — may be racy if there are
         # concurrent calls; prefer per-call resolve for correctness.)
+        # The parent publishes its result before it counts as complete, so no lock is needed to read it.
         parent = self._threaded_method
-        with getattr(parent, "_lock"):
-            parent_result = getattr(parent, "_last_result", MISSING)
-            parent_complete = parent.complete
-        if parent_complete and parent_result is not MISSING:
-            with self._rlock:
-                if self._value is MISSING and self._exc is None:
-                    self._set_value(parent_result)
-                    return parent_result
-        return None
-
-    # watcher thread function used by start_recording
-    def _watcher(self, timeout: Optional[float] = None, capture: bool = False) -> Optional[T3]:
-        start = time.monotonic()
-        while (not self._threaded_method.complete) and (not self.done):
-            if timeout is not None and (time.monotonic() - start) >= timeout:
-                break
-            time.sleep(0.05)
-        if self._threaded_method.complete and capture:
-            return self.capture()
-        return self.value
+        if not parent.complete:
+            return None
+        value = parent._last_result
+        if value is MISSING:
+            return None
+        with self._cond:
+            if self._value is not MISSING or self._exc is not None:
+                return None
+            self._value = value
+            self._cond.notify_all()
+        return value
 
     # wait-for-result API (blocks like concurrent.futures.Future.result)
     def result(self, timeout: Optional[float] = None) -> T3:
         """Wait for the result and return it."""
-        finished = self._event.wait(timeout)
+        finished = self._wait_done(timeout)
         if not finished:
             raise TimeoutError("Resolve.result() timed out")
         # if there was an exception in the worker, re-raise it
@@ -143,18 +195,15 @@ class Resolve(Generic[T3]):
             self._raise()
         # at this point _value must be set
         # hinting: mypy won't deduce but runtime is fine
-        return self.value  # type: ignore[return-value]
+        return self._value  # type: ignore[return-value]
     
     def wait(self, timeout: Optional[float] = None) -> bool:
         """Wait for the method to complete."""
-        finished = self._event.wait(timeout)
+        finished = self._wait_done(timeout)
         if self._exc is not None:
             self._raise()
         return finished
 
-    def __setattr__(self, name: str, value: Any) -> None:
-        raise AttributeError("Resolve instances are immutable")
-
 class ThreadedMethod(Generic[P2, T2]):
     def __init__(self, method: Callable[P2, T2], daemon: bool = True) -> None:
         self._method = method
@@ -162,10 +211,24 @@ class ThreadedMethod(Generic[P2, T2]):
         self._last_thread: Optional[threading.Thread] = None
         self._last_resolve: Optional[Resolve[T2]] = None
         self._last_result: Union[T2, object] = MISSING
-        self._complete = threading.Event()
+        self._recorders: List[Resolve[T2]] = [] # resolves waiting on the next completion
+        self._running: List[None] = [] # one entry per call in flight; append and pop are atomic
+        self._finished = False
         self._lock = threading.Lock()
-        functools.update_wrapper(self, method) # We cannot supply slots for this object.
-        _threaded_methods.add(self)
+        # We cannot supply slots for this object. Only what the class itself would answer 
+        # otherwise is copied now; the rest of the metadata is read through `__getattr__`.
+        self.__wrapped__ = method
+        self.__doc__ = getattr(method, "__doc__", None)
+        self.__module__ = getattr(method, "__module__", None)
+        if not daemon:
+            # daemon calls run on the pool, which cleanup waits for as a whole
+            _threaded_methods.add(self)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for names missing on the instance, e.g. __name__ and __qualname__.
+        if name != "_method" and (name in functools.WRAPPER_ASSIGNMENTS or name in getattr(self._method, "__dict__", ())):
+            return getattr(self._method, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
     @property
     def method(self) -> Callable[P2, T2]:
@@ -173,49 +236,95 @@ class ThreadedMethod(Generic[P2, T2]):
 
     @property
     def thread(self) -> Optional[threading.Thread]:
+        """The thread of the last call. Daemon methods run on pooled workers instead, so for them this is None."""
         return self._last_thread
 
     @property
     def complete(self) -> bool:
-        return self._complete.is_set()
+        return self._finished and not self._running
 
     @property
     def result(self) -> Optional[T2]:
         # None if not complete or value is the MISSING sentinel
-        if self._last_result is MISSING or not self.complete:
+        if not self.complete:
             return None
-        return self._last_result  # type: ignore[return-value]
+        result = self._last_result
+        return None if result is MISSING else result  # type: ignore[return-value]
 
     # internal runner invoked in the worker thread
-    def _runner(self, resolve: Resolve[T2], *args: P2.args, **kwargs: P2.kwargs) -> None:
-        self._complete.clear()
+    # the call's own args tuple and kwargs dict are passed through as they are, not repacked
+    def _runner(self, resolve: Optional[Resolve[T2]], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Optional[T2]:
+        # Without a resolve (direct_call) the value is returned and a failure is raised.
+        self._running.append(None)
+        val: Any = MISSING
+        error: Optional[BaseException] = None
         try:
             val = self._method(*args, **kwargs)
+        except BaseException as e:
+            error = e
+            if resolve is not None:
+                resolve._set_exception(e)
+        else:
             # publish to resolve first (so resolves waiting on parental capture will see it)
-            resolve._set_value(val)
-            with self._lock:
-                object.__setattr__(self, "_last_result", val)
-        except Exception as e:
-            resolve._set_exception(e)
-            with self._lock:
-                object.__setattr__(self, "_last_result", MISSING)
-        finally:
-            self._complete.set()
+            if resolve is not None:
+                resolve._set_value(val)
+        # Publishing order: the last result is stored before the call stops counting as running, 
+        # and readers check `complete` before they read the result, so neither relies on the GIL.
+        with self._lock:
+            self._last_result = val
+            self._running.pop()
+            self._finished = True
+            recorders, self._recorders = self._recorders, []
+        if error is None:
+            for recorder in recorders:
+                recorder._set_value(val)
+            return val
+        for recorder in recorders:
+            recorder._set_exception(error)
+        if resolve is None or not isinstance(error, Exception):
+            raise error
+        return None
     
     def invoke(self, *args: P2.args, **kwargs: P2.kwargs) -> T2:
         """Clean and performant. Simply call the method, and nothing else."""
         return self._method(*args, **kwargs)
 
-    # start a new background thread and return the Resolve handle
+    # run on a background thread and return the Resolve handle
     def threaded_call(self, *args: P2.args, **kwargs: P2.kwargs) -> Resolve[T2]:
         # create the Resolve before starting thread and attach it to self
-        res = Resolve[T2](self)
-        object.__setattr__(self, "_last_resolve", res)
-        # create thread configured with daemon flag
-        self._last_thread = threading.Thread(target=self._runner, args=(res,)+args, kwargs=kwargs, daemon=self._daemon)
+        res: Resolve[T2] = Resolve(self) # unsubscripted: the alias call costs as much as the init
+        self._last_resolve = res
+        if self._daemon:
+            # daemon calls reuse the pooled daemon workers
+            _pool_submit(self._runner, res, args, kwargs)
+            return res
+        # non-daemon calls keep a thread of their own, which the interpreter waits for
+        self._last_thread = threading.Thread(target=self._runner, args=(res, args, kwargs), daemon=False)
         self._last_thread.start()
         return res
 
+    # run on a background thread without any handle, for calls nobody waits on
+    def spawn(self, *args: P2.args, **kwargs: P2.kwargs) -> None:
+        """Fire and forget. Recorded like any call, but no resolve is made; a failure is reported by `threading.excepthook`."""
+        if self._daemon:
+            _pool_submit(self._runner, None, args, kwargs)
+            return
+        self._last_thread = threading.Thread(target=self._runner, args=(None, args, kwargs), daemon=False)
+        self._last_thread.start()
+
+    # run in the calling thread and return an already completed Resolve handle
+    def sync_call(self, *args: P2.args, **kwargs: P2.kwargs) -> Resolve[T2]:
+        """Call the method right here, without a thread, and return its completed resolve."""
+        res: Resolve[T2] = Resolve(self)
+        self._last_resolve = res
+        self._runner(res, args, kwargs)
+        return res
+
+    # run in the calling thread and return the result itself, for callers that would only wait
+    def direct_call(self, *args: P2.args, **kwargs: P2.kwargs) -> T2:
+        """Call the method right here and return its result. Recorded like any call, but no resolve is made."""
+        return self._runner(None, args, kwargs)  # type: ignore[return-value]
+
     def __call__(self, *args: P2.args, **kwargs: P2.kwargs) -> Resolve[T2]:
         return self.threaded_call(*args, **kwargs)
 
@@ -260,10 +369,17 @@ class Wrapper:
         return self._frozen
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if getattr(self, "_frozen", False):
+        try:
+            frozen = self._frozen # a plain slot read; try costs nothing unless it fails
+        except AttributeError: # assigned before Wrapper.__init__ ran
+            frozen = False
+        if frozen:
             raise AttributeError(f"The '{type(self).__name__}' instance is frozen")
         super().__setattr__(name, value)
 
+# classes made by wrap, per (class, wrapper, class keywords); dropped once unused
+_wrapped_classes: weakref.WeakValueDictionary[Tuple[Any, ...], type] = weakref.WeakValueDictionary()
+
 def wrap(cls: Optional[Type[T]] = None, /, wrapper: Type[Wrapper] = Wrapper, **kwds: Any) -> Union[Type[T], Callable[[Type[T]], Type[T]]]:
     """
     Decorator that returns a subclass of the specified wrapper. The wrapper param must be a wrapper inheriting the `Wrapper` class.
@@ -273,6 +389,27 @@ def wrap(cls: Optional[Type[T]] = None, /, wrapper: Type[Wrapper] = Wrapper, **k
         raise TypeError("The wrapper must be inheriting, or be the exact Wrapper.")
 
     def decorator(c: Type[T]) -> Type[T]:
+        try:
+            key = (c, wrapper, frozenset(kwds.items()))
+            cached = _wrapped_classes.get(key)
+        except TypeError: # unhashable class keywords, so the class cannot be shared
+            key = cached = None
+        if cached is not None:
+            return cached
+
+        # the wrapper __init__: initialize the Wrapper base synchronously, then kick off background init
+        init = c.__init__
+        if wrapper.__init__ is Wrapper.__init__:
+            # the base init is known, so inline it and save a frame per instance
+            def new_init(self, *a: Any, **k: Any) -> None:
+                object.__setattr__(self, "_creation", time.monotonic())
+                object.__setattr__(self, "_frozen", False)
+                init(self, *a, **k)
+        else:
+            def new_init(self, *a: Any, **k: Any) -> None:
+                wrapper.__init__(self)
+                init(self, *a, **k)
+
         def exec_body(ns):
             # copy attributes from original class into the new namespace
             for name, val in c.__dict__.items():
@@ -280,6 +417,8 @@ def wrap(cls: Optional[Type[T]] = None, /, wrapper: Type[Wrapper] = Wrapper, **k
                 if name in ("__dict__", "__weakref__", "__module__"):
                     continue
                 ns[name] = val
+            # set in the namespace, so the finished class is not modified afterwards
+            ns["__init__"] = new_init
 
         wrapped = new_class(
             name = c.__name__, 
@@ -287,13 +426,8 @@ def wrap(cls: Optional[Type[T]] = None, /, wrapper: Type[Wrapper] = Wrapper, **k
             kwds = kwds, 
             exec_body = exec_body
         )
-
-        # the wrapper __init__: initialize the Wrapper base synchronously, then kick off background init
-        def new_init(self, *a: Any, **k: Any) -> None:
-            wrapper.__init__(self)
-            c.__init__(self, *a, **k)
-
-        wrapped.__init__ = new_init
+        if key is not None:
+            _wrapped_classes[key] = wrapped
         return wrapped
 
     if cls:
@@ -307,31 +441,21 @@ def is_wrapped(obj_or_cls: Union[Type[T], T]) -> bool:
 
 def cleanup(timeout: Optional[float] = None) -> None:
     """Cleanup all threads during the given timeout."""
-    start = time.monotonic()
-    # join threads created via new_basic_thread
-    for thread in list(_threads):
-        if thread is None: continue
-        if not thread.is_alive(): continue
-        remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
-        thread.join(remaining)
-    _threads.clear()
-
-    # join watcher threads
-    for resolve in list(_resolves):
-        wt = getattr(resolve, "_watch_thread", None)
-        if wt and wt.is_alive():
-            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
-            wt.join(remaining)
-    _resolves.clear()
-
-    # join last threads of threaded_methods if present
+    deadline = None if timeout is None else time.monotonic() + timeout
+    # collect threads created via new_basic_thread and the last threads of threaded_methods
+    alive = [t for t in list(_threads) if t.is_alive()]
     for tm in list(_threaded_methods):
         t = getattr(tm, "_last_thread", None)
-        if t and t.is_alive():
-            remaining = None if timeout is None else max(0.0, timeout - (time.monotonic() - start))
-            t.join(remaining)
+        if t is not None and t.is_alive():
+            alive.append(t)
+    _threads.clear()
     _threaded_methods.clear()
 
+    # wait for pooled calls, then join everything against the same deadline
+    _pool_wait(None if deadline is None else max(0.0, deadline - time.monotonic()))
+    for t in alive:
+        t.join(None if deadline is None else max(0.0, deadline - time.monotonic()))
+
 
 @contextmanager
 def cleanup_context(timeout: Optional[float] = None) -> Generator[None, Any, None]: